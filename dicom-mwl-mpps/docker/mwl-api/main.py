@@ -4,6 +4,7 @@ from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 import os
 import json
+from datetime import datetime
 from mwl_handler import create_mwl_file
 from dotenv import load_dotenv
 from db_utils import insert_mwl_record, get_DB
@@ -36,25 +37,44 @@ async def health_check():
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Database connection failed: {str(e)}")
 
+def create_mwl_entry(json_data):
+    """Write the worklist file for one MWL entry and record it in the database"""
+    # Generate filename from AccessionNumber or timestamp
+    filename = f"{json_data.get('AccessionNumber', datetime.now().strftime('%Y%m%d%H%M%S'))}.wl"
+    output_path = os.path.join(WORKLIST_DIR, filename)
+    ds = create_mwl_file(json_data, output_path)
+    row_id = insert_mwl_record(json_data, ds)
+    return {
+        "status": "success",
+        "message": f"MWL file created: {filename}",
+        "path": output_path,
+        "db_row_id": row_id
+    }
+
 @app.post("/mwl/create_from_json")
 async def create_mwl_from_json(request: Request):
     try:
         json_data = await request.json()
-        # Generate filename from AccessionNumber or timestamp
-        from datetime import datetime
-        filename = f"{json_data.get('AccessionNumber', datetime.now().strftime('%Y%m%d%H%M%S'))}.wl"
-        output_path = os.path.join(WORKLIST_DIR, filename)
-        ds = create_mwl_file(json_data, output_path)
-        row_id = insert_mwl_record(json_data, ds)
-        return JSONResponse({
-            "status": "success",
-            "message": f"MWL file created: {filename}",
-            "path": output_path,
-            "db_row_id": row_id
-        })
+        return JSONResponse(create_mwl_entry(json_data))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/mwl/create_from_json_batch")
+async def create_mwl_from_json_batch(request: Request):
+    """Create several MWL entries from a JSON list; each item is reported separately"""
+    json_list = await request.json()
+    if not isinstance(json_list, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON list of MWL entries")
+    
+    results = []
+    for json_data in json_list:
+        try:
+            results.append(create_mwl_entry(json_data))
+        except Exception as e:
+            results.append({"status": "error", "detail": str(e)})
+    
+    return JSONResponse({"status": "success", "results": results})
+
 @app.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request):
     """Main dashboard page"""
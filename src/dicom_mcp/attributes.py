@@ -2,7 +2,9 @@
 DICOM attribute presets for different query levels.
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 # Dictionary of attribute presets for each query level
 ATTRIBUTE_PRESETS = {
@@ -150,6 +152,13 @@ ATTRIBUTE_PRESETS = {
     },
 }
 
+# Read-only snapshot used to build queries, so callers that modify the
+# ATTRIBUTE_PRESETS returned by get_attribute_presets cannot affect them
+_FROZEN_PRESETS: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    preset: MappingProxyType({level: tuple(attrs) for level, attrs in levels.items()})
+    for preset, levels in ATTRIBUTE_PRESETS.items()
+})
+
 
 def get_attributes_for_level(
     level: str, 
@@ -168,24 +177,35 @@ def get_attributes_for_level(
     Returns:
         List of DICOM attribute names
     """
-    # Start with the preset attributes
-    if preset in ATTRIBUTE_PRESETS and level in ATTRIBUTE_PRESETS[preset]:
-        attr_list = ATTRIBUTE_PRESETS[preset][level].copy()
-    elif preset in ATTRIBUTE_PRESETS and level not in ATTRIBUTE_PRESETS[preset]:
-        # If preset exists but doesn't have this level, fall back to standard
-        attr_list = ATTRIBUTE_PRESETS["standard"][level].copy()
-    else:
-        # If preset doesn't exist, fall back to standard
-        attr_list = ATTRIBUTE_PRESETS["standard"][level].copy()
+    return list(_resolve_attributes(
+        level, preset, tuple(additional_attrs or ()), tuple(exclude_attrs or ())
+    ))
+
+
+@lru_cache(maxsize=128)
+def _resolve_attributes(
+    level: str, preset: str, additional_attrs: Tuple[str, ...], exclude_attrs: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """Resolve a preset with its additions and exclusions.
+    
+    Queries repeat the same handful of combinations, so the merged result is
+    cached; the presets it is built from are read-only.
+    """
+    # Start with the preset attributes; fall back to standard if the preset
+    # doesn't exist or doesn't have this level
+    preset_attrs = _FROZEN_PRESETS.get(preset, {}).get(level)
+    if preset_attrs is None:
+        preset_attrs = _FROZEN_PRESETS["standard"][level]
+    attr_list = list(preset_attrs)
     
     # Add additional attributes
-    if additional_attrs:
-        for attr in additional_attrs:
-            if attr not in attr_list:
-                attr_list.append(attr)
+    for attr in additional_attrs:
+        if attr not in attr_list:
+            attr_list.append(attr)
     
     # Remove excluded attributes
     if exclude_attrs:
-        attr_list = [attr for attr in attr_list if attr not in exclude_attrs]
+        excluded = set(exclude_attrs)
+        attr_list = [attr for attr in attr_list if attr not in excluded]
     
-    return attr_list
\ No newline at end of file
+    return tuple(attr_list)
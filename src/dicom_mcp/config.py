@@ -4,8 +4,9 @@ DICOM configuration using Pydantic.
 
 import yaml
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -17,6 +18,7 @@ class DicomNodeConfig(BaseModel):
     ae_title: str
     description: str = ""
     use_tls: bool = True  # Default to TLS for security
+    max_parallel: int = 0  # Concurrent associations allowed by the node (0 = unlimited)
 
 
 # OpenAI config removed - using standard MCP protocol instead
@@ -51,6 +53,32 @@ class DicomConfiguration(BaseModel):
     fhir: Optional[FhirServerConfig] = None
     mini_ris: Optional[MiniRisDatabaseConfig] = None
     # openai config removed - using standard MCP protocol
+    
+    @cached_property
+    def nodes_listing(self) -> str:
+        """Comma-separated node names, computed once (nodes are fixed after loading)."""
+        return ', '.join(self.nodes.keys())
+    
+    @cached_property
+    def fhir_servers_listing(self) -> Dict[str, Dict[str, Any]]:
+        """Public details of the configured FHIR servers, computed once.
+        
+        Falls back to the legacy single ``fhir`` entry as "default".
+        """
+        if self.fhir_servers:
+            servers = self.fhir_servers
+        elif self.fhir:
+            servers = {"default": self.fhir}
+        else:
+            servers = {}
+        return {
+            name: {
+                "base_url": server_config.base_url,
+                "description": server_config.description,
+                "has_api_key": bool(server_config.api_key)
+            }
+            for name, server_config in servers.items()
+        }
 
 def load_config(config_path: str) -> DicomConfiguration:
     """Load DICOM configuration from YAML file.
@@ -81,11 +109,36 @@ def load_config(config_path: str) -> DicomConfiguration:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file {path} not found")
     
+    # The file is read once per version and environment variables are expanded
+    # on every call, so parsed configurations are cached per expanded text and
+    # follow changes to .env or the environment. Callers get their own copy
+    # because the switch_* tools modify current_node/current_fhir in place.
+    resolved = str(path.resolve())
+    stat = path.stat()
+    content = os.path.expandvars(_read_config(resolved, stat.st_mtime_ns, stat.st_size))
+    config = _parse_config(resolved, content)
+    return config.model_copy(deep=True)
+
+
+@lru_cache(maxsize=4)
+def _read_config(path: str, mtime_ns: int, size: int) -> str:
+    """Read a configuration file; ``mtime_ns`` and ``size`` key the cache on file changes.
+    
+    The size catches rewrites within the timestamp granularity of coarse
+    filesystems, where the modification time alone can stay the same.
+    """
     with open(path, 'r') as f:
-        content = f.read()
-        # Expand environment variables
-        content = os.path.expandvars(content)
-        data = yaml.safe_load(content)
+        return f.read()
+
+
+@lru_cache(maxsize=4)
+def _parse_config(path: str, content: str) -> DicomConfiguration:
+    """Parse configuration text whose environment variables were already expanded.
+    
+    A ``${VAR}`` left in ``content`` names a variable that was unset during
+    expansion, so the lookups below depend on nothing outside the cache key.
+    """
+    data = yaml.safe_load(content)
     
     # Expand FHIR API keys from environment variables
     # Handle legacy single fhir config
@@ -114,4 +167,4 @@ def load_config(config_path: str) -> DicomConfiguration:
     try:
         return DicomConfiguration(**data)
     except Exception as e:
-        raise ValueError(f"Invalid configuration in {path}: {str(e)}")
\ No newline at end of file
+        raise ValueError(f"Invalid configuration in {path}: {str(e)}") from e
\ No newline at end of file
@@ -4,10 +4,15 @@ DICOM Client.
 This module provides a clean interface to pynetdicom functionality,
 abstracting the details of DICOM networking.
 """
+import asyncio
+import logging
 import os
+import threading
 import time
 import tempfile
-from typing import Dict, List, Any, Tuple, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Tuple, Optional
 import ssl
 
 from pydicom import dcmread
@@ -26,11 +31,42 @@ from pynetdicom.sop_class import (
 
 from .attributes import get_attributes_for_level
 
+logger = logging.getLogger("dicom_mcp.dicom_client")
+
+# Waiting longer than this for a free association slot is logged
+_SLOT_WAIT_LOG_SECONDS = 1.0
+
+
+@lru_cache(maxsize=None)
+def _shared_ae(calling_aet: str) -> AE:
+    """Return the process-wide Application Entity for ``calling_aet``.
+    
+    The requested presentation contexts are the same for every client, so
+    clients with the same calling AE title share one AE (associations are
+    independent of each other) instead of each building and configuring its own.
+    """
+    ae = AE(ae_title=calling_aet)
+    
+    # Add the necessary presentation contexts
+    ae.add_requested_context(Verification)
+    ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+    ae.add_requested_context(PatientRootQueryRetrieveInformationModelGet)
+    ae.add_requested_context(PatientRootQueryRetrieveInformationModelMove)
+    ae.add_requested_context(StudyRootQueryRetrieveInformationModelFind)
+    ae.add_requested_context(StudyRootQueryRetrieveInformationModelGet)
+    ae.add_requested_context(StudyRootQueryRetrieveInformationModelMove)
+    
+    # Add specific storage context for PDF - instead of adding all storage contexts
+    ae.add_requested_context(EncapsulatedPDFStorage)
+    return ae
+
+
 class DicomClient:
     """DICOM networking client that handles communication with DICOM nodes."""
     
     def __init__(self, host: str, port: int, calling_aet: str, called_aet: str,
-                 tls_mode: str = "auto"):
+                 tls_mode: str = "auto", linger_timeout: float = 0.0,
+                 max_parallel: int = 0):
         """Initialize DICOM client.
         
         Args:
@@ -42,27 +78,35 @@ class DicomClient:
                       will attempt a TLS association first and fall back to plain
                       if TLS fails to establish. "tls" forces TLS; "plain" forces
                       a non-TLS association.
+            linger_timeout: Seconds to keep the association open after a
+                      C-ECHO/C-FIND/C-MOVE so that the next request reuses it.
+                      0 releases it after every request.
+            max_parallel: Maximum number of operations run against the node at
+                      once; further requests wait for a free slot instead of
+                      opening another association. A lingering association
+                      counts against the limit until it is released. 0 means
+                      unlimited.
         """
         self.host = host
         self.port = port
         self.called_aet = called_aet
         self.calling_aet = calling_aet
         self.tls_mode = tls_mode
+        self.linger_timeout = linger_timeout
+        self.max_parallel = max_parallel
         
-        # Create the Application Entity
-        self.ae = AE(ae_title=calling_aet)
+        # Caps concurrent associations for nodes that reject parallel ones
+        self._slots = threading.BoundedSemaphore(max_parallel) if max_parallel > 0 else None
         
-        # Add the necessary presentation contexts
-        self.ae.add_requested_context(Verification)
-        self.ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
-        self.ae.add_requested_context(PatientRootQueryRetrieveInformationModelGet)
-        self.ae.add_requested_context(PatientRootQueryRetrieveInformationModelMove)
-        self.ae.add_requested_context(StudyRootQueryRetrieveInformationModelFind)
-        self.ae.add_requested_context(StudyRootQueryRetrieveInformationModelGet)
-        self.ae.add_requested_context(StudyRootQueryRetrieveInformationModelMove)
+        # Lingering association, owned by whoever holds _assoc_lock. It keeps
+        # the max_parallel slot of the request that opened it (_assoc_slot).
+        self._assoc = None
+        self._assoc_slot = False
+        self._assoc_lock = threading.Lock()
+        self._linger_timer: Optional[threading.Timer] = None
         
-        # Add specific storage context for PDF - instead of adding all storage contexts
-        self.ae.add_requested_context(EncapsulatedPDFStorage)
+        # Application Entity shared with other clients using the same AE title
+        self.ae = _shared_ae(calling_aet)
 
     def _build_permissive_ssl_context(self) -> ssl.SSLContext:
         """Create a permissive SSL context suitable for local/self-signed servers.
@@ -112,6 +156,135 @@ class DicomClient:
         assoc2 = assoc_plain()
         return assoc2
     
+    def _acquire_slot(self) -> None:
+        """Take one of the ``max_parallel`` slots, waiting for a free one.
+        
+        An idle lingering association holds a slot too; it is released rather
+        than waited out when no slot is free.
+        """
+        started = time.monotonic()
+        if not self._slots.acquire(blocking=False):
+            self._release_idle()
+            self._slots.acquire()
+        waited = time.monotonic() - started
+        if waited > _SLOT_WAIT_LOG_SECONDS:
+            logger.info(
+                "Waited %.1fs for a free association slot on %s:%s (max_parallel=%d)",
+                waited, self.host, self.port, self.max_parallel
+            )
+    
+    @contextmanager
+    def _slot(self):
+        """Hold one of the ``max_parallel`` operation slots for the node."""
+        if self._slots is None:
+            yield
+            return
+        
+        self._acquire_slot()
+        try:
+            yield
+        finally:
+            self._slots.release()
+    
+    @contextmanager
+    def _association(self):
+        """Yield an association for C-ECHO/C-FIND/C-MOVE requests.
+        
+        With a linger timeout the established association is kept after use and
+        handed to the next request; it is released once it has been idle for
+        ``linger_timeout`` seconds. If the lingering association is busy (a
+        concurrent request), a one-off association is used instead. Callers must
+        check ``is_established`` as with ``_associate``. Every association,
+        lingering ones included, holds a ``max_parallel`` slot for as long as it
+        is open.
+        """
+        if not (self.linger_timeout > 0 and self._assoc_lock.acquire(blocking=False)):
+            with self._slot():
+                assoc = self._associate()
+                try:
+                    yield assoc
+                finally:
+                    if assoc.is_established:
+                        assoc.release()
+            return
+        
+        try:
+            self._cancel_linger()
+            # Take over the lingering association together with its slot
+            assoc, holds_slot = self._assoc, self._assoc_slot
+            self._assoc, self._assoc_slot = None, False
+            if self._slots is not None and not holds_slot:
+                self._acquire_slot()
+                holds_slot = True
+            
+            completed = False
+            try:
+                if assoc is None or not assoc.is_established:
+                    assoc = self._associate()
+                yield assoc
+                completed = True
+            finally:
+                if completed and assoc.is_established:
+                    self._assoc, self._assoc_slot = assoc, holds_slot
+                    self._linger_timer = threading.Timer(self.linger_timeout, self._release_idle)
+                    self._linger_timer.daemon = True
+                    self._linger_timer.start()
+                else:
+                    if assoc is not None and assoc.is_established:
+                        assoc.release()
+                    if holds_slot:
+                        self._slots.release()
+        finally:
+            self._assoc_lock.release()
+    
+    def _cancel_linger(self) -> None:
+        if self._linger_timer is not None:
+            self._linger_timer.cancel()
+            self._linger_timer = None
+    
+    def _release_idle(self) -> None:
+        """Release the lingering association unless it is in use.
+        
+        Called by the linger timer, and by _acquire_slot to free the slot of
+        an idle association.
+        """
+        if not self._assoc_lock.acquire(blocking=False):
+            return  # in use; rescheduled when the request finishes
+        try:
+            self._cancel_linger()
+            self._drop_lingering()
+        finally:
+            self._assoc_lock.release()
+    
+    def _drop_lingering(self) -> None:
+        """Release the lingering association and its slot; needs _assoc_lock."""
+        if self._assoc is not None and self._assoc.is_established:
+            self._assoc.release()
+        self._assoc = None
+        if self._assoc_slot:
+            self._assoc_slot = False
+            self._slots.release()
+    
+    def close(self) -> None:
+        """Release the lingering association, if any."""
+        with self._assoc_lock:
+            self._cancel_linger()
+            self._drop_lingering()
+    
+    async def aclose(self) -> None:
+        """Release the lingering association from async code.
+        
+        The A-RELEASE exchange (and waiting for an in-flight request to finish)
+        happens in a worker thread so the event loop is not blocked.
+        """
+        await asyncio.to_thread(self.close)
+    
+    async def __aenter__(self) -> "DicomClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
     def verify_connection(self) -> Tuple[bool, str]:
         """Verify connectivity to the DICOM node using C-ECHO.
         
@@ -119,15 +292,12 @@ class DicomClient:
             Tuple of (success, message)
         """
         # Associate with the DICOM node (TLS-aware)
-        assoc = self._associate()
-        
-        if assoc.is_established:
+        with self._association() as assoc:
+            established = assoc.is_established
             # Send C-ECHO request
-            status = assoc.send_c_echo()
-            
-            # Release the association
-            assoc.release()
-            
+            status = assoc.send_c_echo() if established else None
+        
+        if established:
             if status and status.Status == 0:
                 return True, f"Connection successful to {self.host}:{self.port} (Called AE: {self.called_aet}, Calling AE: {self.calling_aet})"
             else:
@@ -135,40 +305,51 @@ class DicomClient:
         else:
             return False, f"Failed to associate with DICOM node at {self.host}:{self.port} (Called AE: {self.called_aet}, Calling AE: {self.calling_aet})"
     
-    def find(self, query_dataset: Dataset, query_model) -> List[Dict[str, Any]]:
-        """Execute a C-FIND request.
+    def iter_find(self, query_dataset: Dataset, query_model) -> Iterator[Dict[str, Any]]:
+        """Execute a C-FIND request, yielding each match as its response arrives.
+        
+        Each pending C-FIND-RSP is converted and handed over before the next one
+        is read, so only one identifier is held at a time. The association is
+        in use until the generator is exhausted or closed; closing it early
+        releases the association.
         
         Args:
             query_dataset: Dataset containing query parameters
             query_model: DICOM query model (Patient/StudyRoot)
         
-        Returns:
-            List of dictionaries containing query results (empty list if no matches)
+        Yields:
+            Dictionary for each matching record
         
         Raises:
             Exception: If association fails or query execution fails
         """
-        # Associate with the DICOM node (TLS-aware)
-        assoc = self._associate()
-        
-        if not assoc.is_established:
-            raise Exception(f"Failed to associate with DICOM node at {self.host}:{self.port} (Called AE: {self.called_aet}, Calling AE: {self.calling_aet})")
-        
-        results = []
-        
-        try:
+        # Associate with the DICOM node (TLS-aware); released or kept lingering on exit
+        with self._association() as assoc:
+            if not assoc.is_established:
+                raise Exception(f"Failed to associate with DICOM node at {self.host}:{self.port} (Called AE: {self.called_aet}, Calling AE: {self.calling_aet})")
+            
             # Send C-FIND request
             responses = assoc.send_c_find(query_dataset, query_model)
             
             for (status, dataset) in responses:
                 if status and status.Status == 0xFF00:  # Pending
                     if dataset:
-                        results.append(self._dataset_to_dict(dataset))
-        finally:
-            # Always release the association
-            assoc.release()
+                        yield self._dataset_to_dict(dataset)
+    
+    def find(self, query_dataset: Dataset, query_model) -> List[Dict[str, Any]]:
+        """Execute a C-FIND request.
         
-        return results
+        Args:
+            query_dataset: Dataset containing query parameters
+            query_model: DICOM query model (Patient/StudyRoot)
+        
+        Returns:
+            List of dictionaries containing query results (empty list if no matches)
+        
+        Raises:
+            Exception: If association fails or query execution fails
+        """
+        return list(self.iter_find(query_dataset, query_model))
     
     def query_patient(self, patient_id: str = None, name_pattern: str = None, 
                      birth_date: str = None, attribute_preset: str = "standard",
@@ -345,6 +526,68 @@ class DicomClient:
         # Execute query
         return self.find(ds, StudyRootQueryRetrieveInformationModelFind)
     
+    @staticmethod
+    def _send_c_move(assoc, ds: Dataset, destination_ae: str) -> dict:
+        """Send one C-MOVE on an established association and summarize the responses."""
+        result = {
+            "success": False,
+            "message": "C-MOVE operation failed",
+            "completed": 0,
+            "failed": 0,
+            "warning": 0
+        }
+        
+        # Send C-MOVE request with the destination AE title
+        responses = assoc.send_c_move(
+            ds, 
+            destination_ae, 
+            PatientRootQueryRetrieveInformationModelMove
+        )
+        
+        # Process the responses
+        for (status, dataset) in responses:
+            if status:
+                # Record the sub-operation counts if available
+                if hasattr(status, 'NumberOfCompletedSuboperations'):
+                    result["completed"] = status.NumberOfCompletedSuboperations
+                if hasattr(status, 'NumberOfFailedSuboperations'):
+                    result["failed"] = status.NumberOfFailedSuboperations
+                if hasattr(status, 'NumberOfWarningSuboperations'):
+                    result["warning"] = status.NumberOfWarningSuboperations
+                
+                # Check the status code
+                if status.Status == 0x0000:  # Success
+                    result["success"] = True
+                    result["message"] = "C-MOVE operation completed successfully"
+                elif status.Status == 0x0001 or status.Status == 0xB000:  # Success with warnings
+                    result["success"] = True
+                    result["message"] = "C-MOVE operation completed with warnings or failures"
+                elif status.Status == 0xA801:  # Refused: Move destination unknown
+                    result["message"] = f"C-MOVE refused: Destination '{destination_ae}' unknown"
+                else:
+                    result["message"] = f"C-MOVE failed with status 0x{status.Status:04X}"
+                    
+                # If we got a dataset with an error comment, add it
+                if dataset and hasattr(dataset, 'ErrorComment'):
+                    result["message"] += f": {dataset.ErrorComment}"
+        
+        return result
+
+    def _move(self, ds: Dataset, destination_ae: str) -> dict:
+        """Perform a single C-MOVE over the (possibly lingering) association."""
+        # Associate with the DICOM node (TLS-aware)
+        with self._association() as assoc:
+            if not assoc.is_established:
+                return {
+                    "success": False,
+                    "message": f"Failed to associate with DICOM node at {self.host}:{self.port}",
+                    "completed": 0,
+                    "failed": 0,
+                    "warning": 0
+                }
+            
+            return self._send_c_move(assoc, ds, destination_ae)
+
     def move_series(
             self, 
             destination_ae: str,
@@ -374,66 +617,67 @@ class DicomClient:
         ds.QueryRetrieveLevel = "SERIES"
         ds.SeriesInstanceUID = series_instance_uid
         
-        # Associate with the DICOM node (TLS-aware)
-        assoc = self._associate()
-        
-        if not assoc.is_established:
-            return {
-                "success": False,
-                "message": f"Failed to associate with DICOM node at {self.host}:{self.port}",
-                "completed": 0,
-                "failed": 0,
-                "warning": 0
-            }
+        return self._move(ds, destination_ae)
+
+    def move_series_bulk(
+            self, 
+            destination_ae: str,
+            series_instance_uids: List[str]
+        ) -> dict:
+        """Move several DICOM series to another DICOM node over one association.
         
-        result = {
+        Issues one C-MOVE per series, but negotiates the association only once
+        for the whole batch.
+        
+        Args:
+            destination_ae: AE title of the destination DICOM node
+            series_instance_uids: Series Instance UIDs to be moved
+            
+        Returns:
+            Dictionary with overall status, summed sub-operation counts and the
+            per-series results under "series"
+        """
+        summary = {
             "success": False,
-            "message": "C-MOVE operation failed",
+            "message": "",
             "completed": 0,
             "failed": 0,
-            "warning": 0
+            "warning": 0,
+            "series": []
         }
         
-        try:
-            # Send C-MOVE request with the destination AE title
-            responses = assoc.send_c_move(
-                ds, 
-                destination_ae, 
-                PatientRootQueryRetrieveInformationModelMove
-            )
+        # Associate with the DICOM node (TLS-aware)
+        with self._association() as assoc:
+            if not assoc.is_established:
+                summary["message"] = f"Failed to associate with DICOM node at {self.host}:{self.port}"
+                return summary
             
-            # Process the responses
-            for (status, dataset) in responses:
-                if status:
-                    # Record the sub-operation counts if available
-                    if hasattr(status, 'NumberOfCompletedSuboperations'):
-                        result["completed"] = status.NumberOfCompletedSuboperations
-                    if hasattr(status, 'NumberOfFailedSuboperations'):
-                        result["failed"] = status.NumberOfFailedSuboperations
-                    if hasattr(status, 'NumberOfWarningSuboperations'):
-                        result["warning"] = status.NumberOfWarningSuboperations
-                    
-                    # Check the status code
-                    if status.Status == 0x0000:  # Success
-                        result["success"] = True
-                        result["message"] = "C-MOVE operation completed successfully"
-                    elif status.Status == 0x0001 or status.Status == 0xB000:  # Success with warnings
-                        result["success"] = True
-                        result["message"] = "C-MOVE operation completed with warnings or failures"
-                    elif status.Status == 0xA801:  # Refused: Move destination unknown
-                        result["message"] = f"C-MOVE refused: Destination '{destination_ae}' unknown"
-                    else:
-                        result["message"] = f"C-MOVE failed with status 0x{status.Status:04X}"
-                        
-                    # If we got a dataset with an error comment, add it
-                    if dataset and hasattr(dataset, 'ErrorComment'):
-                        result["message"] += f": {dataset.ErrorComment}"
-        
-        finally:
-            # Always release the association
-            assoc.release()
-        
-        return result
+            for series_instance_uid in series_instance_uids:
+                ds = Dataset()
+                ds.QueryRetrieveLevel = "SERIES"
+                ds.SeriesInstanceUID = series_instance_uid
+                
+                if not assoc.is_established:
+                    result = {
+                        "success": False,
+                        "message": "Association lost before C-MOVE",
+                        "completed": 0,
+                        "failed": 0,
+                        "warning": 0
+                    }
+                else:
+                    result = self._send_c_move(assoc, ds, destination_ae)
+                result["series_instance_uid"] = series_instance_uid
+                summary["series"].append(result)
+                
+                summary["completed"] += result["completed"]
+                summary["failed"] += result["failed"]
+                summary["warning"] += result["warning"]
+        
+        succeeded = sum(1 for result in summary["series"] if result["success"])
+        summary["success"] = succeeded == len(series_instance_uids)
+        summary["message"] = f"C-MOVE completed for {succeeded} of {len(series_instance_uids)} series"
+        return summary
 
     def move_study(
             self, 
@@ -464,66 +708,8 @@ class DicomClient:
         ds.QueryRetrieveLevel = "STUDY"
         ds.StudyInstanceUID = study_instance_uid
         
-        # Associate with the DICOM node (TLS-aware)
-        assoc = self._associate()
-        
-        if not assoc.is_established:
-            return {
-                "success": False,
-                "message": f"Failed to associate with DICOM node at {self.host}:{self.port}",
-                "completed": 0,
-                "failed": 0,
-                "warning": 0
-            }
-        
-        result = {
-            "success": False,
-            "message": "C-MOVE operation failed",
-            "completed": 0,
-            "failed": 0,
-            "warning": 0
-        }
-        
-        try:
-            # Send C-MOVE request with the destination AE title
-            responses = assoc.send_c_move(
-                ds, 
-                destination_ae, 
-                PatientRootQueryRetrieveInformationModelMove
-            )
-            
-            # Process the responses
-            for (status, dataset) in responses:
-                if status:
-                    # Record the sub-operation counts if available
-                    if hasattr(status, 'NumberOfCompletedSuboperations'):
-                        result["completed"] = status.NumberOfCompletedSuboperations
-                    if hasattr(status, 'NumberOfFailedSuboperations'):
-                        result["failed"] = status.NumberOfFailedSuboperations
-                    if hasattr(status, 'NumberOfWarningSuboperations'):
-                        result["warning"] = status.NumberOfWarningSuboperations
-                    
-                    # Check the status code
-                    if status.Status == 0x0000:  # Success
-                        result["success"] = True
-                        result["message"] = "C-MOVE operation completed successfully"
-                    elif status.Status == 0x0001 or status.Status == 0xB000:  # Success with warnings
-                        result["success"] = True
-                        result["message"] = "C-MOVE operation completed with warnings or failures"
-                    elif status.Status == 0xA801:  # Refused: Move destination unknown
-                        result["message"] = f"C-MOVE refused: Destination '{destination_ae}' unknown"
-                    else:
-                        result["message"] = f"C-MOVE failed with status 0x{status.Status:04X}"
-                        
-                    # If we got a dataset with an error comment, add it
-                    if dataset and hasattr(dataset, 'ErrorComment'):
-                        result["message"] += f": {dataset.ErrorComment}"
-        
-        finally:
-            # Always release the association
-            assoc.release()
-        
-        return result
+        return self._move(ds, destination_ae)
+
     def extract_pdf_text_from_dicom(
             self, 
             study_instance_uid: str,
@@ -599,46 +785,49 @@ class DicomClient:
         # during the C-GET operation
         role = build_role(EncapsulatedPDFStorage, scp_role=True)
         
-        # Associate with the DICOM node, providing the event handlers during association (TLS-aware)
-        assoc = self._associate(evt_handlers=handlers, ext_neg=[role])
+        with self._slot():
+            # Associate with the DICOM node, providing the event handlers during association (TLS-aware)
+            assoc = self._associate(evt_handlers=handlers, ext_neg=[role])
         
-        if not assoc.is_established:
-            return {
-                "success": False,
-                "message": f"Failed to associate with DICOM node at {self.host}:{self.port}",
-                "text_content": "",
-                "file_path": ""
-            }
+            if not assoc.is_established:
+                return {
+                    "success": False,
+                    "message": f"Failed to associate with DICOM node at {self.host}:{self.port}",
+                    "text_content": "",
+                    "file_path": ""
+                }
         
-        success = False
-        message = "C-GET operation failed"
-        pdf_path = ""
-        extracted_text = ""
+            success = False
+            message = "C-GET operation failed"
+            pdf_path = ""
+            extracted_text = ""
         
-        try:
-            # Send C-GET request - without evt_handlers parameter since we provided them during association
-            responses = assoc.send_c_get(ds, PatientRootQueryRetrieveInformationModelGet)
+            try:
+                # Send C-GET request - without evt_handlers parameter since we provided them during association
+                responses = assoc.send_c_get(ds, PatientRootQueryRetrieveInformationModelGet)
             
-            for (status, dataset) in responses:
-                if status:
-                    status_int = status.Status if hasattr(status, 'Status') else 0
+                for (status, dataset) in responses:
+                    if status:
+                        status_int = status.Status if hasattr(status, 'Status') else 0
                     
-                    if status_int == 0x0000:  # Success
-                        success = True
-                        message = "C-GET operation completed successfully"
-                    elif status_int == 0xFF00:  # Pending
-                        success = True  # Still processing
-                        message = "C-GET operation in progress"
-        finally:
-            # Always release the association
-            assoc.release()
+                        if status_int == 0x0000:  # Success
+                            success = True
+                            message = "C-GET operation completed successfully"
+                        elif status_int == 0xFF00:  # Pending
+                            success = True  # Still processing
+                            message = "C-GET operation in progress"
+            finally:
+                # Always release the association
+                assoc.release()
         
         # Process received files
         if received_files:
             dicom_file = received_files[0]
             
-            # Read the DICOM file
-            ds = dcmread(dicom_file)
+            # Read the DICOM file. EncapsulatedDocument (0042,0011) sorts before
+            # Pixel Data, so nothing needed here is lost by stopping there and
+            # any pixel or trailing padding data is never loaded.
+            ds = dcmread(dicom_file, stop_before_pixels=True)
             
             # Check if it's an encapsulated PDF
             if (hasattr(ds, 'SOPClassUID') and 
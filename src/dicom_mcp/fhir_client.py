@@ -4,10 +4,24 @@ FHIR Client.
 This module provides a clean interface for FHIR REST API operations,
 abstracting the details of FHIR networking via HTTP.
 """
+import json
+import threading
 import httpx
+from cachetools import TTLCache
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# orjson parses Bundles several times faster than the stdlib and reads the
+# response bytes directly; fall back to json if it is missing
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Seconds a search/read result is reused for an identical request; workflows
+# tend to look up the same patient or study several times in a row
+_READ_CACHE_TTL_SECONDS = 30
+
 
 class FhirClient:
     """FHIR REST API client that handles communication with FHIR servers."""
@@ -27,6 +41,44 @@ class FhirClient:
         
         if api_key:
             self.headers["apikey"] = api_key
+        
+        # One connection pool per client so keep-alive connections (and their
+        # TLS sessions) are reused across requests
+        self._http = httpx.Client(
+            headers=self.headers,
+            verify=False,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+        
+        # Recent search/read response bodies; cleared by every create/update/delete
+        self._read_cache: TTLCache = TTLCache(maxsize=256, ttl=_READ_CACHE_TTL_SECONDS)
+        self._read_cache_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._http.close()
+    
+    def _cached_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GET ``url`` and return the JSON body, reusing a recent identical request.
+        
+        The raw body is cached and decoded on every hit, so callers that modify
+        a result never change what later reads of the same request see.
+        """
+        key = (url, json.dumps(params, sort_keys=True, default=str) if params else "")
+        with self._read_cache_lock:
+            content = self._read_cache.get(key)
+        if content is None:
+            response = self._http.get(url, params=params or {}, timeout=30.0)
+            response.raise_for_status()
+            content = response.content
+            with self._read_cache_lock:
+                self._read_cache[key] = content
+        return _json_loads(content)
+    
+    def _invalidate_reads(self) -> None:
+        with self._read_cache_lock:
+            self._read_cache.clear()
     
     def search_resource(
         self, 
@@ -45,10 +97,7 @@ class FhirClient:
         Raises:
             httpx.HTTPStatusError: If the request fails
         """
-        url = f"{self.base_url}/{resource_type}"
-        response = httpx.get(url, headers=self.headers, params=params or {}, timeout=30.0, verify=False, follow_redirects=True)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"{self.base_url}/{resource_type}", params)
     
     def read_resource(
         self, 
@@ -67,10 +116,7 @@ class FhirClient:
         Raises:
             httpx.HTTPStatusError: If the request fails
         """
-        url = f"{self.base_url}/{resource_type}/{resource_id}"
-        response = httpx.get(url, headers=self.headers, timeout=30.0, verify=False, follow_redirects=True)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"{self.base_url}/{resource_type}/{resource_id}")
     
     def create_resource(
         self, 
@@ -105,9 +151,10 @@ class FhirClient:
             # Regular resources go to their type endpoint
             url = f"{self.base_url}/{resource_type}"
         
-        response = httpx.post(url, headers=self.headers, json=resource, timeout=60.0, verify=False, follow_redirects=True)
+        response = self._http.post(url, json=resource, timeout=60.0)
+        self._invalidate_reads()
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     def update_resource(
         self, 
@@ -133,18 +180,20 @@ class FhirClient:
             raise ValueError("Resource must include 'id' field for updates")
         
         url = f"{self.base_url}/{resource_type}/{resource_id}"
-        response = httpx.put(url, headers=self.headers, json=resource, timeout=30.0, verify=False, follow_redirects=True)
+        response = self._http.put(url, json=resource, timeout=30.0)
+        self._invalidate_reads()
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     def delete_resource(self, resource_type: str, resource_id: str) -> dict:
         """Delete a FHIR resource by type and id."""
         url = f"{self.base_url}/{resource_type}/{resource_id}"
-        resp = httpx.delete(url, headers=self.headers, timeout=30.0, verify=False, follow_redirects=True)
+        resp = self._http.delete(url, timeout=30.0)
+        self._invalidate_reads()
         if resp.status_code == 204:
             return {"success": True}
         try:
-            return resp.json()
+            return _json_loads(resp.content)
         except Exception:
             return {"success": resp.status_code in (200, 202)}
 
@@ -154,9 +203,9 @@ class FhirClient:
             url = f"{self.base_url}/{resource_type}/$metadata"
         else:
             url = f"{self.base_url}/metadata"
-        resp = httpx.get(url, headers=self.headers, timeout=30.0, verify=False, follow_redirects=True)
+        resp = self._http.get(url, timeout=30.0)
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
 
     def verify_connection(self) -> tuple[bool, str]:
         """Verify connectivity to the FHIR server using a capability statement.
@@ -167,21 +216,11 @@ class FhirClient:
         try:
             url = f"{self.base_url}/metadata"
             
-            # Create a client with more lenient settings
-            client = httpx.Client(
-                timeout=60.0,
-                verify=False,
-                follow_redirects=True
-            )
-            
-            try:
-                response = client.get(url, headers=self.headers)
-                response.raise_for_status()
-                metadata = response.json()
-                fhir_version = metadata.get("fhirVersion", "unknown")
-                return True, f"FHIR server connection successful (FHIR version: {fhir_version})"
-            finally:
-                client.close()
+            response = self._http.get(url, timeout=60.0)
+            response.raise_for_status()
+            metadata = _json_loads(response.content)
+            fhir_version = metadata.get("fhirVersion", "unknown")
+            return True, f"FHIR server connection successful (FHIR version: {fhir_version})"
                 
         except httpx.TimeoutException:
             return False, f"Connection to FHIR server timed out. Check network/firewall settings or server availability."
@@ -13,6 +13,42 @@ from mysql.connector import pooling
 
 logger = logging.getLogger("dicom_mcp.mysql")
 
+# Order/patient/procedure/provider columns needed to build an MWL entry
+_MWL_ORDER_SELECT = """
+    SELECT 
+        o.order_id,
+        o.order_number,
+        o.accession_number,
+        o.modality_code,
+        o.scheduled_start,
+        o.scheduled_end,
+        o.status AS order_status,
+        o.priority,
+        o.reason_description,
+        o.performing_provider_id,
+        p.patient_id,
+        p.mrn,
+        p.given_name,
+        p.family_name,
+        p.date_of_birth,
+        p.sex,
+        op.procedure_code,
+        op.procedure_description,
+        op.laterality,
+        proc.typical_views,
+        proc.typical_image_count,
+        prov.given_name AS performing_physician_given,
+        prov.family_name AS performing_physician_family,
+        ordering_prov.given_name AS ordering_physician_given,
+        ordering_prov.family_name AS ordering_physician_family
+    FROM orders o
+    INNER JOIN patients p ON o.patient_id = p.patient_id
+    INNER JOIN order_procedures op ON o.order_id = op.order_id
+    INNER JOIN procedures proc ON op.procedure_code = proc.procedure_code
+    LEFT JOIN providers prov ON o.performing_provider_id = prov.provider_id
+    LEFT JOIN providers ordering_prov ON o.ordering_provider_id = ordering_prov.provider_id
+"""
+
 
 @dataclass
 class MiniRisConnectionSettings:
@@ -290,39 +326,7 @@ class MiniRisClient:
         Returns:
             Dictionary with order, patient, procedure, and provider data, or None if not found
         """
-        sql = """
-            SELECT 
-                o.order_id,
-                o.order_number,
-                o.accession_number,
-                o.modality_code,
-                o.scheduled_start,
-                o.scheduled_end,
-                o.status AS order_status,
-                o.priority,
-                o.reason_description,
-                o.performing_provider_id,
-                p.patient_id,
-                p.mrn,
-                p.given_name,
-                p.family_name,
-                p.date_of_birth,
-                p.sex,
-                op.procedure_code,
-                op.procedure_description,
-                op.laterality,
-                proc.typical_views,
-                proc.typical_image_count,
-                prov.given_name AS performing_physician_given,
-                prov.family_name AS performing_physician_family,
-                ordering_prov.given_name AS ordering_physician_given,
-                ordering_prov.family_name AS ordering_physician_family
-            FROM orders o
-            INNER JOIN patients p ON o.patient_id = p.patient_id
-            INNER JOIN order_procedures op ON o.order_id = op.order_id
-            INNER JOIN procedures proc ON op.procedure_code = proc.procedure_code
-            LEFT JOIN providers prov ON o.performing_provider_id = prov.provider_id
-            LEFT JOIN providers ordering_prov ON o.ordering_provider_id = ordering_prov.provider_id
+        sql = _MWL_ORDER_SELECT + """
             WHERE o.order_id = %s
             LIMIT 1
         """
@@ -335,6 +339,74 @@ class MiniRisClient:
             
         return result
 
+    def get_orders_for_mwl(self, order_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Fetch MWL data for several orders in a single query.
+        
+        Args:
+            order_ids: The order IDs to fetch
+            
+        Returns:
+            Dictionary mapping order_id to the same row shape as get_order_for_mwl;
+            orders that do not exist are absent
+        """
+        order_ids = list(dict.fromkeys(order_ids))
+        if not order_ids:
+            return {}
+        
+        placeholders = ", ".join(["%s"] * len(order_ids))
+        sql = _MWL_ORDER_SELECT + f"""
+            WHERE o.order_id IN ({placeholders})
+            ORDER BY o.order_id, op.order_procedure_id
+        """
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(sql, tuple(order_ids))
+            rows = cursor.fetchall()
+            cursor.close()
+        
+        # Keep the first procedure per order, matching get_order_for_mwl
+        orders: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            orders.setdefault(row["order_id"], row)
+        return orders
+
+    _ORDER_BY_ACCESSION_SQL = """
+        SELECT 
+            o.order_id, o.accession_number, o.modality_code,
+            COALESCE(o.body_part_code, proc.body_part_code, 'CHEST') as body_part_code,
+            o.image_generation_prompt, o.report_findings_description,
+            p.mrn, p.given_name, p.family_name, p.date_of_birth, p.sex,
+            CONCAT(p.family_name, '^', p.given_name) as patient_name,
+            op.procedure_description,
+            proc.typical_views, proc.typical_image_count
+        FROM orders o
+        JOIN patients p ON o.patient_id = p.patient_id
+        JOIN order_procedures op ON o.order_id = op.order_id
+        LEFT JOIN procedures proc ON op.procedure_code = proc.procedure_code
+        WHERE o.accession_number = %s
+        LIMIT 1
+    """
+
+    def get_order_by_accession(self, accession_number: str) -> Optional[Dict[str, Any]]:
+        """Fetch order, patient and procedure data needed to acquire a study.
+        
+        Args:
+            accession_number: The accession number of the order
+            
+        Returns:
+            Dictionary with order, patient, and procedure data, or None if not found
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute(self._ORDER_BY_ACCESSION_SQL, (accession_number,))
+                result = cursor.fetchone()
+            finally:
+                cursor.close()
+        
+        return result
+
     def get_study_by_accession(self, accession_number: str) -> Optional[Dict[str, Any]]:
         """Fetch complete study information by accession number for reporting.
         
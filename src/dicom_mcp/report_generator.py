@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import io
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -22,6 +22,20 @@ from reportlab.platypus import (
 def generate_radiology_report_pdf(report_data: Dict[str, Any]) -> bytes:
     """Generate a professional radiology report PDF.
     
+    Args:
+        report_data: Report fields, see generate_radiology_report_pdf_to
+            
+    Returns:
+        PDF bytes
+    """
+    buffer = io.BytesIO()
+    generate_radiology_report_pdf_to(report_data, buffer)
+    return buffer.getvalue()
+
+
+def generate_radiology_report_pdf_to(report_data: Dict[str, Any], out: BinaryIO) -> None:
+    """Generate a professional radiology report PDF into a binary file object.
+    
     Args:
         report_data: Dictionary containing report fields from database:
             - report_number: Report identifier
@@ -40,16 +54,11 @@ def generate_radiology_report_pdf(report_data: Dict[str, Any]) -> bytes:
             - author_given_name: Radiologist first name (optional)
             - author_family_name: Radiologist last name (optional)
             - credentials: Radiologist credentials (optional)
-            
-    Returns:
-        PDF bytes
+        out: Writable binary file object (e.g. ``io.BytesIO`` or an open file)
     """
-    # Create PDF buffer
-    buffer = io.BytesIO()
-    
     # Create document
     doc = SimpleDocTemplate(
-        buffer,
+        out,
         pagesize=letter,
         rightMargin=0.75*inch,
         leftMargin=0.75*inch,
@@ -235,10 +244,4 @@ def generate_radiology_report_pdf(report_data: Dict[str, Any]) -> bytes:
     
     # Build PDF
     doc.build(story)
-    
-    # Get PDF bytes
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    
-    return pdf_bytes
 
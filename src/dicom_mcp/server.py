@@ -2,18 +2,29 @@
 DICOM MCP Server main implementation.
 """
 
-import base64
+import asyncio
+import io
 import json
 import logging
 import os
+import re
 import requests
 import tempfile
+import threading
+import time
+import urllib3
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, AsyncIterator, Optional, Tuple, Union
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING, Dict, List, Any, AsyncIterator, Callable, Literal, Optional, Tuple, Union
 
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mcp.server.fastmcp import FastMCP, Context
 try:
     from mcp.server.fastmcp import ToolResult
@@ -25,6 +36,22 @@ except ImportError:
     except ImportError:
         ToolResult = None
         TextContent = None
+
+# orjson decodes straight from the response bytes and encodes straight to bytes,
+# several times faster than the stdlib; fall back to json if it is missing
+try:
+    from orjson import dumps as _json_dumps_bytes, loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# pybase64 dispatches to SIMD (SSE/AVX2/NEON) encoders; same API as the stdlib
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 import pydicom
 from pydicom.dataset import Dataset, FileMetaDataset
 from pydicom.uid import generate_uid, ExplicitVRLittleEndian
@@ -32,24 +59,325 @@ from pydicom.uid import generate_uid, ExplicitVRLittleEndian
 from .attributes import ATTRIBUTE_PRESETS
 from .dicom_client import DicomClient
 from .fhir_client import FhirClient
-from .mysql_client import MiniRisClient, MiniRisConnectionSettings
-from .config import DicomConfiguration, load_config
-from .virtual_cr import VirtualCRDevice
-from .report_generator import generate_radiology_report_pdf
+from .config import DicomConfiguration, DicomNodeConfig, MiniRisDatabaseConfig, load_config
 from .resources import StaticResource, load_resource_catalog
 
+if TYPE_CHECKING:
+    # Imported on first use: the MySQL driver and the imaging stack are only
+    # needed by the tools that use them
+    from .mysql_client import MiniRisClient
+    from .virtual_cr import VirtualCRDevice
+
 # Configure logging
 logger = logging.getLogger("dicom_mcp")
 
+# (connect, read) timeout for the MWL API and Orthanc REST calls, so an
+# unreachable host fails at connect time instead of after the read timeout
+_HTTP_TIMEOUT = (1.5, 10)
+
+
+class _DefaultTimeoutSession(requests.Session):
+    """requests.Session that applies ``_HTTP_TIMEOUT`` unless a call passes its own."""
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", _HTTP_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+
+# Shared HTTP session for the Orthanc REST API. Orthanc runs with self-signed
+# certificates, so TLS verification is disabled once here instead of per call.
+# The adapter keeps a few keep-alive connections per host and retries failed
+# connects (and idempotent requests) twice with a short backoff.
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+_orthanc_session = _DefaultTimeoutSession()
+_orthanc_session.verify = False
+_orthanc_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
+_orthanc_session.mount("https://", _orthanc_adapter)
+_orthanc_session.mount("http://", _orthanc_adapter)
+
+# The /system probe of _get_orthanc_base_url only asks whether Orthanc is
+# there, so it gets its own session without retries: an unreachable node
+# costs one connect timeout per port before query_studies falls back.
+_orthanc_probe_session = _DefaultTimeoutSession()
+_orthanc_probe_session.verify = False
+_orthanc_probe_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0)
+_orthanc_probe_session.mount("https://", _orthanc_probe_adapter)
+_orthanc_probe_session.mount("http://", _orthanc_probe_adapter)
+
+# Keep-alive session for the MWL API (plain HTTP on the docker network). The
+# pool matches the parallel single-entry POSTs of the batch fallback; failed
+# connects are retried, but POSTs that reached the server are not (urllib3
+# only retries reads for idempotent methods).
+_mwl_session = _DefaultTimeoutSession()
+_mwl_adapter = HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
+_mwl_session.mount("http://", _mwl_adapter)
+_mwl_session.mount("https://", _mwl_adapter)
+# Bodies are encoded with _json_dumps_bytes and passed as data=
+_mwl_session.headers["Content-Type"] = "application/json"
+
+# Simple circuit breaker per host: after _CIRCUIT_FAILURE_THRESHOLD consecutive
+# connection failures, calls fail immediately until the cooldown has passed.
+_CIRCUIT_FAILURE_THRESHOLD = 3
+_CIRCUIT_COOLDOWN_SECONDS = 30.0
+# Callers run in worker threads, so updates are serialized by _circuit_guard.
+_circuit_state: Dict[str, Tuple[int, float]] = {}
+_circuit_guard = threading.Lock()
+
+
+def _circuit_is_open(url: str) -> bool:
+    """Return True if calls to the host of ``url`` should be short-circuited."""
+    failures, opened_at = _circuit_state.get(urlsplit(url).netloc, (0, 0.0))
+    return (
+        failures >= _CIRCUIT_FAILURE_THRESHOLD
+        and time.monotonic() - opened_at < _CIRCUIT_COOLDOWN_SECONDS
+    )
+
+
+def _circuit_record(url: str, success: bool) -> None:
+    """Reset (on success) or bump (on failure) the failure count for a host."""
+    host = urlsplit(url).netloc
+    with _circuit_guard:
+        if success:
+            _circuit_state.pop(host, None)
+        else:
+            failures, _ = _circuit_state.get(host, (0, 0.0))
+            _circuit_state[host] = (failures + 1, time.monotonic())
+
+
+# Seconds a DICOM association stays open after a request so that follow-up
+# queries/moves skip the TCP + A-ASSOCIATE handshake. Kept well below the
+# usual SCP idle timeout (Orthanc: 30 s).
+_ASSOCIATION_LINGER_SECONDS = 10.0
+
+# Upper bound on concurrent per-study series lookups (C-FIND or Orthanc REST)
+_SERIES_QUERY_PARALLELISM = 8
+
+# Query keys checked before any association is opened. DA matching allows a
+# single date or a range with either end open; UI matching allows a
+# backslash-separated list of UIDs (no wildcards).
+_DICOM_DATE_RE = re.compile(r"\d{8}(-(\d{8})?)?|-\d{8}")
+_DICOM_UID_LIST_RE = re.compile(r"[0-9]+(\.[0-9]+)*(\\[0-9]+(\.[0-9]+)*)*")
+_ATTRIBUTE_PRESET_NAMES = frozenset(ATTRIBUTE_PRESETS)
+
+
+def _check_dicom_date(name: str, value: Optional[str]) -> None:
+    """Raise ValueError unless ``value`` is empty or a DICOM date/date range."""
+    if value and not _DICOM_DATE_RE.fullmatch(value):
+        raise ValueError(
+            f"Invalid {name} '{value}': expected YYYYMMDD or a range such as YYYYMMDD-YYYYMMDD"
+        )
+
+
+def _check_dicom_uid(name: str, value: Optional[str]) -> None:
+    """Raise ValueError unless ``value`` is empty or a (list of) DICOM UID(s)."""
+    if value and not _DICOM_UID_LIST_RE.fullmatch(value):
+        raise ValueError(f"Invalid {name} '{value}': expected a DICOM UID such as 1.2.840.10008.1.1")
+
 
-@dataclass
+def _check_attribute_preset(value: str) -> None:
+    """Raise ValueError unless ``value`` names one of the attribute presets."""
+    if value not in _ATTRIBUTE_PRESET_NAMES:
+        raise ValueError(
+            f"Invalid attribute_preset '{value}': expected one of {', '.join(ATTRIBUTE_PRESETS)}"
+        )
+
+
+def _pooled_client(
+    clients: Dict[Tuple[str, int, str, str], DicomClient], node: DicomNodeConfig, calling_aet: str
+) -> DicomClient:
+    """Return the pooled DicomClient for ``node``, creating it on first use."""
+    key = (node.host, node.port, calling_aet, node.ae_title)
+    client = clients.get(key)
+    if client is None:
+        client = DicomClient(
+            host=node.host,
+            port=node.port,
+            calling_aet=calling_aet,
+            called_aet=node.ae_title,
+            linger_timeout=_ASSOCIATION_LINGER_SECONDS,
+            max_parallel=node.max_parallel
+        )
+        clients[key] = client
+    return client
+
+
+# Successful extract_pdf_text_from_dicom results keyed by SOPInstanceUID. An
+# instance never changes under its UID, so entries need no expiry; only read
+# and written by the tool coroutine, so no lock is needed.
+_pdf_text_cache: LRUCache = LRUCache(maxsize=128)
+
+
+@dataclass(slots=True)
 class DicomContext:
     """Context for the DICOM MCP server."""
     config: DicomConfiguration
-    client: DicomClient
+    # Client for config.current_node, created on first use (see get_client)
+    client: Optional[DicomClient] = None
     fhir_client: Optional[FhirClient] = None
-    mini_ris_client: Optional[MiniRisClient] = None
+    # Resolves to the mini-RIS client (None if it could not connect), see
+    # connect_mini_ris_in_background
+    mini_ris_future: Optional[Future] = None
     resources: Dict[str, StaticResource] = None
+    temp_files: List[str] = field(default_factory=list)
+    synthetic_studies: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # DicomClient per (host, port, calling AE, called AE), see _pooled_client
+    clients: Dict[Tuple[str, int, str, str], DicomClient] = field(default_factory=dict)
+    # list_dicom_nodes text, built on first call and cleared when the node changes
+    nodes_summary: Optional[str] = None
+    
+    def get_client(self) -> DicomClient:
+        """Return the DicomClient for the current node, creating it on first use."""
+        if self.client is None:
+            node = self.config.nodes[self.config.current_node]
+            self.client = _pooled_client(self.clients, node, self.config.calling_aet)
+        return self.client
+    
+    @property
+    def mini_ris_client(self) -> Optional["MiniRisClient"]:
+        """The mini-RIS client, waiting for the startup connection if still pending."""
+        if self.mini_ris_future is None:
+            return None
+        return self.mini_ris_future.result()
+    
+    def remove_temp_files(self) -> None:
+        """Remove files handed out by path (e.g. generated report PDFs)."""
+        for path in self.temp_files:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self.temp_files.clear()
+
+
+def _connect_mini_ris(mini_ris_config: MiniRisDatabaseConfig) -> Optional["MiniRisClient"]:
+    """Create the mini-RIS MySQL client and check connectivity; None on failure."""
+    try:
+        from .mysql_client import MiniRisClient, MiniRisConnectionSettings
+        
+        mini_ris_client = MiniRisClient(MiniRisConnectionSettings(
+            host=mini_ris_config.host,
+            port=mini_ris_config.port,
+            user=mini_ris_config.user,
+            password=mini_ris_config.password,
+            database=mini_ris_config.database,
+            pool_size=mini_ris_config.pool_size,
+        ))
+        mini_ris_client.ping()
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.warning("Failed to initialize Mini-RIS client: %s", exc)
+        return None
+    logger.info(
+        "Mini-RIS MySQL client initialized (host=%s, db=%s)",
+        mini_ris_config.host,
+        mini_ris_config.database,
+    )
+    return mini_ris_client
+
+
+def connect_mini_ris_in_background(mini_ris_config: MiniRisDatabaseConfig) -> Future:
+    """Start connecting to the mini-RIS database in a worker thread.
+    
+    Opening the MySQL pool can take up to the connect timeout when the database
+    is unreachable; startup carries on and the first tool that needs the client
+    waits on the returned future instead.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mini-ris-connect")
+    future = executor.submit(_connect_mini_ris, mini_ris_config)
+    executor.shutdown(wait=False)
+    return future
+
+
+@lru_cache(maxsize=4)
+def _virtual_cr_device(openai_api_key: Optional[str]) -> "VirtualCRDevice":
+    """Return the virtual CR device for ``openai_api_key``, reused across studies.
+    
+    The device keeps its OpenAI client, so repeated AI image generation reuses
+    the client's connection pool. Keyed by the key so a changed key takes effect.
+    """
+    # Imported on first use: pulls in numpy, Pillow and (optionally) openai
+    from .virtual_cr import VirtualCRDevice
+    
+    return VirtualCRDevice(openai_api_key=openai_api_key)
+
+
+def _run_in_thread(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Turn a blocking tool function into a coroutine that runs it in a worker thread.
+    
+    Used under @mcp.tool() for tools that do database, HTTP or DICOM I/O, so they
+    don't stall the event loop. wraps() keeps the signature and docstring that
+    FastMCP builds the tool schema from.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+
+# system_prompt.txt in the project root (next to src/)
+_SYSTEM_PROMPT_PATH = Path(os.path.abspath(__file__)).parents[2] / "system_prompt.txt"
+
+# Used by get_system_prompt when system_prompt.txt does not exist
+_DEFAULT_SYSTEM_PROMPT = """You are a medical imaging assistant specialized in DICOM and FHIR workflows. Help users query, analyze, and manage medical imaging data efficiently using the available DICOM tools, including DIMSE, FHIR and DicomWeb.
+
+Key responsibilities:
+- Assist with patient, study, series, and instance queries using the DICOM tools.
+- Assist with reading, writing and analyzing data using FHIR tools (work in progress).
+- Extract and summarize text from DICOM-encapsulated PDF reports
+- Help transfer DICOM data between nodes using C-MOVE operations
+- Provide clear explanations of DICOM concepts and operations
+- Always prioritize data privacy and security
+
+Important reminders:
+- This tool is for research and development purposes only
+- Never make clinical diagnoses based on the data
+- Verify patient information before sharing results
+- Use clear, clinical language when appropriate
+- Most data is retrieved as JSON, but please present the data in either JSON or a tabular form that is human readable.
+- When extracting text from DICOM PDF reports, summarize findings clearly, highlight key measurements and recommendations, and maintain clinical accuracy in your summaries. Organize information in a structured format that's easy to read and understand."""
+
+
+def _load_system_prompt() -> Optional[str]:
+    """Return the text of system_prompt.txt, or None if there is no such file.
+    
+    The file is read again only when its modification time changes.
+    """
+    try:
+        mtime_ns = _SYSTEM_PROMPT_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _read_system_prompt(mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _read_system_prompt(mtime_ns: int) -> str:
+    return _SYSTEM_PROMPT_PATH.read_text(encoding='utf-8').strip()
+
+
+def _config_and_client(ctx: Context) -> Tuple[DicomConfiguration, DicomClient]:
+    """Return the session's configuration and current DICOM client in one step."""
+    dicom_ctx = ctx.request_context.lifespan_context
+    return dicom_ctx.config, dicom_ctx.get_client()
+
+
+def _query_error_result(what: str, error: Exception) -> Dict[str, Any]:
+    """Translate a failed query the way the query_* tools report it.
+    
+    Connection/association errors are re-raised (chained to ``error``) so the
+    client sees them; any other error yields an empty result in FastMCP's
+    {"result": [...]} format, which prevents serialization issues.
+    """
+    error_msg = str(error)
+    if "Failed to associate" in error_msg or "connection" in error_msg.lower():
+        raise Exception(f"Error querying {what}: {error_msg}") from error
+    return {"result": []}
 
 
 def _format_query_result(results: List[Dict[str, Any]], empty_message: str = "No results found.") -> Dict[str, Any]:
@@ -68,9 +396,412 @@ def _format_query_result(results: List[Dict[str, Any]], empty_message: str = "No
     return {"result": results if results else []}
 
 
+def _orthanc_lookup(
+    orthanc_base_url: str,
+    uid: str,
+    resource_type: str,
+    timeout: Union[float, Tuple[float, float]],
+) -> List[str]:
+    """Resolve a DICOM UID to Orthanc resource IDs via ``/tools/lookup``.
+    
+    Unlike ``/tools/find`` this is a direct index lookup rather than a query.
+    
+    Args:
+        orthanc_base_url: Base URL of the Orthanc REST API
+        uid: StudyInstanceUID, SeriesInstanceUID or SOPInstanceUID
+        resource_type: Orthanc resource type to keep ("Study", "Series", "Instance")
+        timeout: Request timeout in seconds, or a (connect, read) tuple
+        
+    Returns:
+        List of Orthanc IDs of the requested type (empty if not found)
+    """
+    response = _orthanc_session.post(
+        f"{orthanc_base_url}/tools/lookup",
+        data=uid,
+        timeout=timeout
+    )
+    response.raise_for_status()
+    return [match["ID"] for match in _json_loads(response.content) if match.get("Type") == resource_type]
+
+
+def _record_mwl_task(
+    mini_ris_client: "MiniRisClient",
+    order_data: Dict[str, Any],
+    scheduled_station_aet: str,
+    mwl_payload: Dict[str, Any],
+) -> Optional[int]:
+    """Record an MWL task in the mini-RIS for audit trail.
+    
+    Failures are logged and swallowed; the worklist entry already exists.
+    
+    Returns:
+        The new mwl_task_id, or None if the record could not be created
+    """
+    order_id = order_data['order_id']
+    scheduled_dt = order_data['scheduled_start']
+    try:
+        # Calculate scheduled_end if not provided (default: 15 minutes after start)
+        scheduled_end = order_data.get('scheduled_end')
+        if not scheduled_end and scheduled_dt:
+            scheduled_end = scheduled_dt + timedelta(minutes=15)
+        
+        mwl_task_id = mini_ris_client.create_mwl_task(
+            order_id=order_id,
+            scheduled_station_aet=scheduled_station_aet,
+            scheduled_station_name=None,  # Could be derived from station AET if needed
+            scheduled_start=scheduled_dt,
+            scheduled_end=scheduled_end,
+            scheduled_performing_provider_id=order_data.get('performing_provider_id'),
+            mwl_payload=mwl_payload,
+        )
+        logger.info("Created MWL task %s for order %s", mwl_task_id, order_id)
+        return mwl_task_id
+    except Exception as e:
+        logger.warning("Failed to create MWL task record: %s", e)
+        return None
+
+
+def _post_mwl_batch(mwl_api_url: str, mwl_payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Create several MWL entries through the MWL API.
+    
+    Uses the ``/mwl/create_from_json_batch`` endpoint; older mwl-api images
+    without it get parallel ``/mwl/create_from_json`` POSTs instead.
+    
+    Args:
+        mwl_api_url: Base URL of the MWL API service
+        mwl_payloads: Payloads built by _build_mwl_payload
+        
+    Returns:
+        One result per payload, in order. Failed entries have status "error".
+        
+    Raises:
+        requests.exceptions.RequestException: If the batch endpoint fails, or
+            if no single POST of the fallback could reach the MWL API
+    """
+    response = _mwl_session.post(
+        f"{mwl_api_url}/mwl/create_from_json_batch",
+        data=_json_dumps_bytes(mwl_payloads),
+        timeout=(_HTTP_TIMEOUT[0], 30)
+    )
+    if response.status_code not in (404, 405):
+        response.raise_for_status()
+        return _json_loads(response.content)["results"]
+    
+    logger.info("MWL API has no batch endpoint, posting entries individually")
+    
+    connection_errors: List[requests.exceptions.RequestException] = []
+    
+    def post_one(mwl_payload: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            single = _mwl_session.post(
+                f"{mwl_api_url}/mwl/create_from_json",
+                data=_json_dumps_bytes(mwl_payload)
+            )
+            single.raise_for_status()
+            return _json_loads(single.content)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            connection_errors.append(e)
+            return {"status": "error", "detail": str(e)}
+        except requests.exceptions.RequestException as e:
+            return {"status": "error", "detail": str(e)}
+    
+    # I/O bound, so threads overlap the round trips
+    with ThreadPoolExecutor(max_workers=min(8, len(mwl_payloads))) as executor:
+        results = list(executor.map(post_one, mwl_payloads))
+    
+    # Nothing reached the MWL API: fail like the batch call so that the
+    # caller's circuit breaker counts it
+    if len(connection_errors) == len(mwl_payloads):
+        raise connection_errors[0]
+    return results
+
+
+# Input chunk size for streamed base64 encoding. It must be a multiple of 3 so
+# that only the final chunk can produce "=" padding (chunks concatenate into a
+# valid encoding). 57 KiB = 152 * 384 (3 * 128) keeps the SIMD encoder on whole
+# blocks and encodes to 76 KiB, small enough to stay cache-resident.
+_B64_CHUNK_SIZE = 57 * 1024
+
+
+def _json_body_with_base64_content(
+    payload: Dict[str, Any], key: str, prefix: str, data: Union[bytes, memoryview]
+) -> bytearray:
+    """Serialize ``payload`` as JSON with ``key`` set to ``prefix`` + base64(``data``).
+    
+    The body is allocated once at its exact final size and the encoded data is
+    written into it chunk by chunk, so no full-size base64 ``str`` (or second
+    copy inside the JSON string) is created. Pass the result as ``data=`` to
+    requests.
+    """
+    head_bytes = b''.join((
+        _json_dumps_bytes(payload)[:-1],  # reopen the object to append the key
+        b',' if payload else b'',
+        _json_dumps_bytes(key),
+        b':"',
+        prefix.encode('utf-8'),
+    ))
+    tail_bytes = b'"}'
+    view = memoryview(data)
+    encoded_len = (len(view) + 2) // 3 * 4
+    
+    body = bytearray(len(head_bytes) + encoded_len + len(tail_bytes))
+    body[:len(head_bytes)] = head_bytes
+    pos = len(head_bytes)
+    for offset in range(0, len(view), _B64_CHUNK_SIZE):
+        encoded = b64encode(view[offset:offset + _B64_CHUNK_SIZE])
+        body[pos:pos + len(encoded)] = encoded
+        pos += len(encoded)
+    body[pos:] = tail_bytes
+    return body
+
+
+# Fixed tags of the Encapsulated PDF instance that attach_report_to_pacs creates
+_REPORT_PDF_STATIC_TAGS = {
+    "Modality": "DOC",
+    "SeriesNumber": "9999",
+    "SOPClassUID": "1.2.840.10008.5.1.4.1.1.104.1",  # Encapsulated PDF Storage
+    "InstanceNumber": "1",
+    "MIMETypeOfEncapsulatedDocument": "application/pdf",
+}
+
+
+# Report statuses accepted by create_radiology_report (message keeps workflow order)
+_REPORT_STATUS_ORDER = ('Preliminary', 'Final', 'Amended', 'Cancelled')
+_VALID_REPORT_STATUSES = frozenset(_REPORT_STATUS_ORDER)
+_VALID_REPORT_STATUSES_MSG = ', '.join(_REPORT_STATUS_ORDER)
+
+# Report rows (multi-join query) and rendered PDFs keyed by report_id, so the
+# usual generate -> attach flow loads and renders a report once. Both are
+# dropped through _invalidate_report when the report changes. The report tools
+# run in worker threads, so every access holds the cache's lock.
+_report_cache: TTLCache = TTLCache(maxsize=64, ttl=60)
+_report_cache_lock = threading.Lock()
+_report_pdf_cache: TTLCache = TTLCache(maxsize=64, ttl=300)
+_report_pdf_cache_lock = threading.Lock()
+
+
+def _get_report_cached(mini_ris_client: "MiniRisClient", report_id: int) -> Dict[str, Any]:
+    """Return the report row for ``report_id``, reusing a recent fetch.
+    
+    Raises:
+        ValueError: If the report does not exist
+    """
+    with _report_cache_lock:
+        report_data = _report_cache.get(report_id)
+    if report_data is None:
+        report_data = mini_ris_client.get_report_by_id(report_id)
+        if not report_data:
+            raise ValueError(f"No report found with ID: {report_id}")
+        with _report_cache_lock:
+            _report_cache[report_id] = report_data
+    return report_data
+
+
+def _invalidate_report(report_id: int) -> None:
+    """Drop cached data for a report after it was created or modified."""
+    with _report_cache_lock:
+        _report_cache.pop(report_id, None)
+    with _report_pdf_cache_lock:
+        _report_pdf_cache.pop(report_id, None)
+
+
+def _report_version(report_data: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Return the fields of a report row that change whenever the report does."""
+    return report_data.get('updated_at'), report_data.get('report_status')
+
+
+def _build_report_pdf(mini_ris_client: "MiniRisClient", report_id: int) -> Tuple[Dict[str, Any], memoryview]:
+    """Fetch a report and render its PDF, reusing a recent rendering if cached.
+    
+    Args:
+        mini_ris_client: Client used to load the report
+        report_id: The report ID to render
+        
+    Returns:
+        Tuple of (report_data, pdf). The PDF is a read-only view of the render
+        buffer, so it is never copied into a separate bytes object. It is
+        always rendered from the returned report_data.
+        
+    Raises:
+        ValueError: If the report does not exist
+    """
+    report_data = _get_report_cached(mini_ris_client, report_id)
+    with _report_pdf_cache_lock:
+        cached = _report_pdf_cache.get(report_id)
+    # Only reuse a rendering of the same version of the row, so a report
+    # changed outside _invalidate_report is rendered again
+    if cached is not None and _report_version(cached[0]) == _report_version(report_data):
+        return cached
+    
+    # Imported on first use: reportlab is only needed by the reporting tools
+    from .report_generator import generate_radiology_report_pdf_to
+    
+    buffer = io.BytesIO()
+    generate_radiology_report_pdf_to(report_data, buffer)
+    entry = (report_data, buffer.getbuffer().toreadonly())
+    with _report_pdf_cache_lock:
+        _report_pdf_cache[report_id] = entry
+    return entry
+
+
+# Orthanc study lookups for attach_report_to_pacs keyed by (base URL,
+# StudyInstanceUID) -> (Orthanc study ID, AccessionNumber), so attaching
+# several reports to one study verifies it once. Concurrent lookups of the
+# same study wait on a per-key lock and reuse the first result.
+_study_lookup_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+_study_lookup_guard = threading.Lock()
+_study_lookup_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+
+def _find_orthanc_study(base_url: str, study_instance_uid: str) -> Tuple[str, str]:
+    """Find a study in Orthanc by StudyInstanceUID, reusing a recent lookup.
+    
+    Args:
+        base_url: Orthanc REST API base URL
+        study_instance_uid: The StudyInstanceUID to look up
+        
+    Returns:
+        Tuple of (Orthanc study ID, AccessionNumber or '')
+        
+    Raises:
+        ValueError: If the study is missing or the UID matches several studies
+    """
+    key = (base_url, study_instance_uid)
+    with _study_lookup_guard:
+        cached = _study_lookup_cache.get(key)
+        if cached is not None:
+            return cached
+        key_lock = _study_lookup_locks.setdefault(key, threading.Lock())
+    
+    with key_lock:
+        try:
+            with _study_lookup_guard:
+                cached = _study_lookup_cache.get(key)
+            if cached is not None:
+                return cached
+            
+            # Expand returns MainDicomTags inline, so the AccessionNumber needs
+            # no separate GET /studies/{id}
+            response = _orthanc_session.post(
+                f"{base_url}/tools/find",
+                json={
+                    "Level": "Study",
+                    "Query": {"StudyInstanceUID": study_instance_uid},
+                    "Expand": True,
+                },
+            )
+            _circuit_record(base_url, success=True)
+            response.raise_for_status()
+            studies = _json_loads(response.content)
+            
+            if not studies:
+                raise ValueError(
+                    f"Study with UID {study_instance_uid} not found in Orthanc PACS. "
+                    f"Ensure the imaging study exists before attaching the report."
+                )
+            if len(studies) > 1:
+                logger.warning(
+                    "Multiple studies found with same UID: %s", [study['ID'] for study in studies]
+                )
+                raise ValueError(
+                    f"Multiple studies found with StudyInstanceUID {study_instance_uid}. "
+                    f"DICOM hierarchy violation - StudyInstanceUID must be unique!"
+                )
+            
+            study = studies[0]
+            entry = (study['ID'], study.get('MainDicomTags', {}).get('AccessionNumber', ''))
+            with _study_lookup_guard:
+                _study_lookup_cache[key] = entry
+            return entry
+        finally:
+            with _study_lookup_guard:
+                _study_lookup_locks.pop(key, None)
+
+
+def _remember_orthanc_study(base_url: str, study_instance_uid: str, entry: Optional[Tuple[str, str]]) -> None:
+    """Refresh (or with ``entry=None`` drop) a cached Orthanc study lookup."""
+    key = (base_url, study_instance_uid)
+    with _study_lookup_guard:
+        if entry is None:
+            _study_lookup_cache.pop(key, None)
+        else:
+            _study_lookup_cache[key] = entry
+
+
+# Scheduled Procedure Step keys in the order the MWL API expects them. Copied
+# per order via dict(), which is cheaper than re-building the literal.
+_SPS_TEMPLATE: Dict[str, Any] = {
+    "Modality": None,
+    "ScheduledStationAETitle": None,
+    "ScheduledProcedureStepStartDate": None,
+    "ScheduledProcedureStepStartTime": None,
+    "ScheduledProcedureStepDescription": None,
+    "ScheduledProcedureStepID": None,
+}
+
+
+def _build_mwl_payload(order_data: Dict[str, Any], scheduled_station_aet: str) -> Dict[str, Any]:
+    """Build the MWL API JSON payload for a mini-RIS order.
+    
+    Args:
+        order_data: Row returned by ``MiniRisClient.get_order_for_mwl``
+        scheduled_station_aet: AE Title of the acquisition station
+        
+    Returns:
+        Dictionary with the DICOM worklist attributes, including the
+        Scheduled Procedure Step Sequence
+    """
+    # One strftime call, sliced into DICOM DA (YYYYMMDD) and TM (HHMMSS)
+    scheduled_stamp = order_data['scheduled_start'].strftime('%Y%m%d%H%M%S')
+    
+    scheduled_procedure_step = dict(
+        _SPS_TEMPLATE,
+        Modality=order_data['modality_code'],
+        ScheduledStationAETitle=scheduled_station_aet,
+        ScheduledProcedureStepStartDate=scheduled_stamp[:8],
+        ScheduledProcedureStepStartTime=scheduled_stamp[8:],
+        ScheduledProcedureStepDescription=order_data['procedure_description'],
+        ScheduledProcedureStepID=f"SPS{order_data['order_id']}",
+    )
+    
+    # Add optional performing physician to SPS
+    if order_data.get('performing_physician_family') and order_data.get('performing_physician_given'):
+        scheduled_procedure_step["ScheduledPerformingPhysicianName"] = (
+            f"{order_data['performing_physician_family']}^{order_data['performing_physician_given']}"
+        )
+    
+    mwl_payload = {
+        "AccessionNumber": order_data['accession_number'],
+        "PatientID": order_data['mrn'],
+        "PatientName": f"{order_data['family_name']}^{order_data['given_name']}",
+        "PatientBirthDate": order_data['date_of_birth'].strftime('%Y%m%d'),
+        "PatientSex": order_data['sex'],
+        # prefix=None yields a UUID-derived "2.25." UID, skipping the
+        # hash-based derivation used for the default pydicom root
+        "StudyInstanceUID": generate_uid(prefix=None),
+        "RequestedProcedureDescription": order_data['procedure_description'],
+        "RequestedProcedureID": order_data['order_number'],
+        "ScheduledProcedureStepSequence": [scheduled_procedure_step],
+    }
+    
+    # Add optional top-level fields
+    if order_data.get('reason_description'):
+        mwl_payload["RequestedProcedureComments"] = order_data['reason_description']
+    
+    return mwl_payload
+
+
 def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMCP:
     """Create and configure a DICOM MCP server."""
     
+    # Connection-holding resources shared by every session of this server. With
+    # the SSE transport the lifespan is entered once per client session; each
+    # session keeps its own configuration (selected node / FHIR server) but
+    # reuses the DICOM client pool and the mini-RIS MySQL pool. The last session
+    # to end releases the lingering associations.
+    shared: Dict[str, Any] = {"sessions": 0, "clients": {}, "mini_ris_future": None}
+    shared_lock = asyncio.Lock()
+    
     # Define a simple lifespan function
     @asynccontextmanager
     async def lifespan(server: FastMCP) -> AsyncIterator[DicomContext]:
@@ -78,22 +809,14 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         # Load config
         config = load_config(str(config_path_obj))
         
-        # Get the current node and calling AE title
-        current_node = config.nodes[config.current_node]
-        
-        # Load static resources
-        resources_dir = config_path_obj.parent / "resources"
-        resource_catalog = load_resource_catalog(resources_dir)
+        # Static resources: the catalog parsed when the server was created (and
+        # registered with FastMCP below) is reused instead of re-reading the manifest
 
-        # Create DICOM client
-        client = DicomClient(
-            host=current_node.host,
-            port=current_node.port,
-            calling_aet=config.calling_aet,
-            called_aet=current_node.ae_title
-        )
+        if config.current_node not in config.nodes:
+            raise ValueError(f"Current node '{config.current_node}' not found in configuration")
         
-        logger.info(f"DICOM client initialized: {config.current_node} (calling AE: {config.calling_aet})")
+        # The DICOM client is created by the first tool that needs it
+        logger.info(f"DICOM node selected: {config.current_node} (calling AE: {config.calling_aet})")
         
         # Create FHIR client if configured
         # Support multiple FHIR servers (new) or single fhir (legacy)
@@ -122,39 +845,33 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             )
             logger.info(f"FHIR client initialized: {fhir_config.base_url} (server: {config.current_fhir or 'default'})")
         
-        mini_ris_client: Optional[MiniRisClient] = None
-
-        if config.mini_ris:
-            try:
-                mini_ris_settings = MiniRisConnectionSettings(
-                    host=config.mini_ris.host,
-                    port=config.mini_ris.port,
-                    user=config.mini_ris.user,
-                    password=config.mini_ris.password,
-                    database=config.mini_ris.database,
-                    pool_size=config.mini_ris.pool_size,
-                )
-                mini_ris_client = MiniRisClient(mini_ris_settings)
-                # Optional connectivity check
-                mini_ris_client.ping()
-                logger.info(
-                    "Mini-RIS MySQL client initialized (host=%s, db=%s)",
-                    config.mini_ris.host,
-                    config.mini_ris.database,
-                )
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.warning("Failed to initialize Mini-RIS client: %s", exc)
-
+        async with shared_lock:
+            shared["sessions"] += 1
+            # Connect once for all sessions; retried by the next session if it failed
+            pending = shared["mini_ris_future"]
+            if config.mini_ris and (pending is None or (pending.done() and pending.result() is None)):
+                shared["mini_ris_future"] = connect_mini_ris_in_background(config.mini_ris)
+        
+        dicom_ctx = DicomContext(
+            config=config,
+            fhir_client=fhir_client,
+            mini_ris_future=shared["mini_ris_future"] if config.mini_ris else None,
+            resources=resource_catalog,
+            clients=shared["clients"],
+        )
         try:
-            yield DicomContext(
-                config=config,
-                client=client,
-                fhir_client=fhir_client,
-                mini_ris_client=mini_ris_client,
-                resources=resource_catalog,
-            )
+            yield dicom_ctx
         finally:
-            pass
+            async with shared_lock:
+                shared["sessions"] -= 1
+                if shared["sessions"] == 0:
+                    # Last session: release lingering associations concurrently
+                    # and drop the clients
+                    await asyncio.gather(*(pooled.aclose() for pooled in shared["clients"].values()))
+                    shared["clients"].clear()
+            if dicom_ctx.fhir_client is not None:
+                dicom_ctx.fhir_client.close()
+            dicom_ctx.remove_temp_files()
     
     # Create server
     mcp = FastMCP(name, lifespan=lifespan)
@@ -384,14 +1101,9 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             logger.info("Found PromptManager on FastMCP instance")
             
             # Load system prompt from file
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(os.path.dirname(script_dir))
-            prompt_path = os.path.join(project_root, "system_prompt.txt")
+            prompt_text = _load_system_prompt()
             
-            if os.path.exists(prompt_path):
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    prompt_text = f.read().strip()
-                
+            if prompt_text is not None:
                 # Try to register the prompt using @mcp.prompt decorator (similar to @mcp.resource)
                 if hasattr(mcp, 'prompt') and callable(getattr(mcp, 'prompt', None)):
                     try:
@@ -483,7 +1195,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
                 except Exception as e:
                     logger.debug(f"Could not list prompts from PromptManager: {e}")
             else:
-                logger.debug(f"System prompt file not found at {prompt_path}")
+                logger.debug(f"System prompt file not found at {_SYSTEM_PROMPT_PATH}")
         else:
             logger.debug("PromptManager not found on FastMCP instance")
     except Exception as e:
@@ -506,12 +1218,14 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             Human-readable string describing the current node and available nodes
         """
         dicom_ctx = ctx.request_context.lifespan_context
-        config = dicom_ctx.config
-        
-        # Return human-readable text instead of dict to avoid FastMCP stringifying JSON
-        # This prevents the schema validation error in MCP Jam
-        nodes_str = ', '.join(config.nodes.keys())
-        return f"Current node: {config.current_node}\nAvailable nodes: {nodes_str}\nStatus: success"
+        if dicom_ctx.nodes_summary is None:
+            config = dicom_ctx.config
+            # Return human-readable text instead of dict to avoid FastMCP stringifying JSON
+            # This prevents the schema validation error in MCP Jam
+            dicom_ctx.nodes_summary = (
+                f"Current node: {config.current_node}\nAvailable nodes: {config.nodes_listing}\nStatus: success"
+            )
+        return dicom_ctx.nodes_summary
     
     @mcp.tool()
     def list_saved_resources(ctx: Context = None) -> Dict[str, Any]:
@@ -543,7 +1257,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         return data
 
     @mcp.tool()
-    def extract_pdf_text_from_dicom(
+    async def extract_pdf_text_from_dicom(
         study_instance_uid: str,
         series_instance_uid: str,
         sop_instance_uid: str,
@@ -576,14 +1290,25 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
                 "file_path": "/tmp/tmpdir123/1.2.3.4.5.6.7.8.dcm"
             }
         """
-        dicom_ctx = ctx.request_context.lifespan_context
-        client:DicomClient = dicom_ctx.client
+        _check_dicom_uid("study_instance_uid", study_instance_uid)
+        _check_dicom_uid("series_instance_uid", series_instance_uid)
+        _check_dicom_uid("sop_instance_uid", sop_instance_uid)
+        
+        cached = _pdf_text_cache.get(sop_instance_uid)
+        if cached is not None:
+            return dict(cached)
         
-        return client.extract_pdf_text_from_dicom(
+        _, client = _config_and_client(ctx)
+        
+        result = await asyncio.to_thread(
+            client.extract_pdf_text_from_dicom,
             study_instance_uid=study_instance_uid,
             series_instance_uid=series_instance_uid,
             sop_instance_uid=sop_instance_uid
         )
+        if result.get("success"):
+            _pdf_text_cache[sop_instance_uid] = dict(result)
+        return result
 
     @mcp.tool()
     def switch_dicom_node(node_name: str, ctx: Context = None) -> Dict[str, Any]:
@@ -613,22 +1338,28 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         config = dicom_ctx.config
         
         # Check if node exists
-        if node_name not in config.nodes:
+        node = config.nodes.get(node_name)
+        if node is None:
             raise ValueError(f"Node '{node_name}' not found in configuration")
         
-        # Update configuration
-        config.current_node = node_name
-        
-        # Create a new client with the updated configuration
-        current_node = config.nodes[config.current_node]
+        # Nothing to do if the node is already selected and the active client
+        # (if one was created yet) talks to it
+        client = dicom_ctx.client
+        if config.current_node == node_name and (
+            client is None
+            or (client.host, client.port, client.calling_aet, client.called_aet)
+            == (node.host, node.port, config.calling_aet, node.ae_title)
+        ):
+            return {
+                "success": True,
+                "message": f"DICOM node already selected: {node_name}"
+            }
         
-        # Replace the client with a new instance
-        dicom_ctx.client = DicomClient(
-            host=current_node.host,
-            port=current_node.port,
-            calling_aet=config.calling_aet,
-            called_aet=current_node.ae_title
-        )
+        # Update configuration; the node's client is picked from the pool (or
+        # created) by the next tool that needs it
+        config.current_node = node_name
+        dicom_ctx.client = None
+        dicom_ctx.nodes_summary = None
         
         return {
             "success": True,
@@ -636,7 +1367,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         }
 
     @mcp.tool()
-    def verify_connection(ctx: Context = None) -> str:
+    async def verify_connection(ctx: Context = None) -> str:
         """Verify connectivity to the current DICOM node using C-ECHO.
         
         This tool performs a DICOM C-ECHO operation (similar to a network ping) to check
@@ -649,14 +1380,13 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         Example:
             "Connection successful to 192.168.1.100:104 (Called AE: ORTHANC, Calling AE: CLIENT)"
         """
-        dicom_ctx = ctx.request_context.lifespan_context
-        client = dicom_ctx.client
+        _, client = _config_and_client(ctx)
         
-        success, message = client.verify_connection()
+        success, message = await asyncio.to_thread(client.verify_connection)
         return message
 
     @mcp.tool()
-    def query_patients(
+    async def query_patients(
         name_pattern: str = "", 
         patient_id: str = "", 
         birth_date: str = "", 
@@ -701,17 +1431,20 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         Raises:
             Exception: If there is an error communicating with the DICOM node
         """
-        dicom_ctx = ctx.request_context.lifespan_context
-        client = dicom_ctx.client
+        _check_dicom_date("birth_date", birth_date)
+        _check_attribute_preset(attribute_preset)
+        
+        _, client = _config_and_client(ctx)
         
         try:
-            results = client.query_patient(
+            results = await asyncio.to_thread(
+                client.query_patient,
                 patient_id=patient_id,
                 name_pattern=name_pattern,
                 birth_date=birth_date,
                 attribute_preset=attribute_preset,
-                additional_attrs=additional_attributes or [],
-                exclude_attrs=exclude_attributes or []
+                additional_attrs=additional_attributes,
+                exclude_attrs=exclude_attributes
             )
             # Always return a list, even if empty (no patients found is a valid result)
             results = results if isinstance(results, list) else []
@@ -719,13 +1452,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             # This matches the structure when results are found, ensuring consistent format
             return {"result": results}
         except Exception as e:
-            # For connection/association errors, re-raise them
-            error_msg = str(e)
-            if "Failed to associate" in error_msg or "connection" in error_msg.lower():
-                raise Exception(f"Error querying patients: {error_msg}")
-            # For other errors (including empty results), return empty result structure
-            # This matches FastMCP's format and prevents serialization issues
-            return {"result": []}
+            return _query_error_result("patients", e)
 
     def _get_orthanc_base_url(dicom_ctx: DicomContext) -> Optional[str]:
         """Get Orthanc REST API base URL if we're connected to Orthanc.
@@ -738,17 +1465,23 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             # Try common Orthanc REST API ports
             for port in [8042, 8043]:
                 base_url = f"https://{current_node.host}:{port}"
+                # Skip ports that recently failed to connect
+                if _circuit_is_open(base_url):
+                    continue
                 try:
                     # Quick check if Orthanc REST API is available
-                    response = requests.get(
+                    response = _orthanc_probe_session.get(
                         f"{base_url}/system",
-                        timeout=2,
-                        verify=False
+                        timeout=2
                     )
-                    if response.status_code == 200:
-                        return base_url
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    _circuit_record(base_url, success=False)
+                    continue
                 except Exception:
                     continue
+                if response.status_code == 200:
+                    _circuit_record(base_url, success=True)
+                    return base_url
         except Exception:
             pass
         return None
@@ -764,18 +1497,8 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             List of series dictionaries with their attributes
         """
         try:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            
             # First, find the study ID in Orthanc
-            search_response = requests.post(
-                f"{orthanc_base_url}/tools/find",
-                json={"Level": "Study", "Query": {"StudyInstanceUID": study_instance_uid}},
-                timeout=5,
-                verify=False
-            )
-            search_response.raise_for_status()
-            study_ids = search_response.json()
+            study_ids = _orthanc_lookup(orthanc_base_url, study_instance_uid, "Study", timeout=5)
             
             if not study_ids:
                 return []
@@ -784,13 +1507,12 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             study_id = study_ids[0]
             
             # Get detailed study information including series
-            study_response = requests.get(
+            study_response = _orthanc_session.get(
                 f"{orthanc_base_url}/studies/{study_id}",
-                timeout=5,
-                verify=False
+                timeout=5
             )
             study_response.raise_for_status()
-            study_info = study_response.json()
+            study_info = _json_loads(study_response.content)
             
             # Get series IDs from the study
             series_ids = study_info.get("Series", [])
@@ -801,13 +1523,12 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             series_list = []
             for series_id in series_ids:
                 try:
-                    series_response = requests.get(
+                    series_response = _orthanc_session.get(
                         f"{orthanc_base_url}/series/{series_id}",
-                        timeout=5,
-                        verify=False
+                        timeout=5
                     )
                     series_response.raise_for_status()
-                    series_info = series_response.json()
+                    series_info = _json_loads(series_response.content)
                     
                     # Extract relevant series information
                     main_tags = series_info.get("MainDicomTags", {})
@@ -842,18 +1563,8 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             List of instance dictionaries with their attributes
         """
         try:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            
             # First, find the series ID in Orthanc
-            search_response = requests.post(
-                f"{orthanc_base_url}/tools/find",
-                json={"Level": "Series", "Query": {"SeriesInstanceUID": series_instance_uid}},
-                timeout=5,
-                verify=False
-            )
-            search_response.raise_for_status()
-            series_ids = search_response.json()
+            series_ids = _orthanc_lookup(orthanc_base_url, series_instance_uid, "Series", timeout=5)
             
             if not series_ids:
                 return []
@@ -862,13 +1573,12 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             series_id = series_ids[0]
             
             # Get detailed series information including instances
-            series_response = requests.get(
+            series_response = _orthanc_session.get(
                 f"{orthanc_base_url}/series/{series_id}",
-                timeout=5,
-                verify=False
+                timeout=5
             )
             series_response.raise_for_status()
-            series_info = series_response.json()
+            series_info = _json_loads(series_response.content)
             
             # Get instance IDs from the series
             instance_ids = series_info.get("Instances", [])
@@ -879,13 +1589,12 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             instance_list = []
             for instance_id in instance_ids:
                 try:
-                    instance_response = requests.get(
+                    instance_response = _orthanc_session.get(
                         f"{orthanc_base_url}/instances/{instance_id}",
-                        timeout=5,
-                        verify=False
+                        timeout=5
                     )
                     instance_response.raise_for_status()
-                    instance_info = instance_response.json()
+                    instance_info = _json_loads(instance_response.content)
                     
                     # Extract relevant instance information
                     main_tags = instance_info.get("MainDicomTags", {})
@@ -909,7 +1618,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             return []
 
     @mcp.tool()
-    def query_studies(
+    async def query_studies(
         patient_id: str = "", 
         study_date: str = "", 
         modality_in_study: str = "",
@@ -977,12 +1686,17 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         Raises:
             Exception: If there is an error communicating with the DICOM node
         """
+        _check_dicom_date("study_date", study_date)
+        _check_dicom_uid("study_instance_uid", study_instance_uid)
+        _check_attribute_preset(attribute_preset)
+        
         dicom_ctx = ctx.request_context.lifespan_context
-        client = dicom_ctx.client
+        client = dicom_ctx.get_client()
         
         try:
             # Get studies via DICOM C-FIND
-            studies = client.query_study(
+            studies = await asyncio.to_thread(
+                client.query_study,
                 patient_id=patient_id,
                 study_date=study_date,
                 modality=modality_in_study,
@@ -990,36 +1704,114 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
                 accession_number=accession_number,
                 study_instance_uid=study_instance_uid,
                 attribute_preset=attribute_preset,
-                additional_attrs=additional_attributes or [],
-                exclude_attrs=exclude_attributes or []
+                additional_attrs=additional_attributes,
+                exclude_attrs=exclude_attributes
             )
             
             # Try to enrich with series information if we're using Orthanc
-            orthanc_base_url = _get_orthanc_base_url(dicom_ctx)
+            orthanc_base_url = await asyncio.to_thread(_get_orthanc_base_url, dicom_ctx)
             if orthanc_base_url:
                 logger.debug(f"Enriching studies with series information from Orthanc at {orthanc_base_url}")
-                for study in studies:
+                semaphore = asyncio.Semaphore(_SERIES_QUERY_PARALLELISM)
+                
+                async def enrich(study: Dict[str, Any]) -> None:
                     study_uid = study.get("StudyInstanceUID")
-                    if study_uid:
-                        series_list = _get_series_for_study(orthanc_base_url, study_uid)
-                        if series_list:
-                            study["Series"] = series_list
-                            logger.debug(f"Added {len(series_list)} series to study {study_uid}")
+                    if not study_uid:
+                        return
+                    async with semaphore:
+                        series_list = await asyncio.to_thread(_get_series_for_study, orthanc_base_url, study_uid)
+                    if series_list:
+                        study["Series"] = series_list
+                        logger.debug("Added %d series to study %s", len(series_list), study_uid)
+                
+                # Studies are looked up concurrently rather than one after another
+                await asyncio.gather(*(enrich(study) for study in studies))
             
             # Return in FastMCP's expected format: {"result": [...]}
             # This matches the structure when results are found, ensuring consistent format
             return {"result": studies if isinstance(studies, list) else []}
         except Exception as e:
-            # For connection/association errors, re-raise them
-            error_msg = str(e)
-            if "Failed to associate" in error_msg or "connection" in error_msg.lower():
-                raise Exception(f"Error querying studies: {error_msg}")
-            # For other errors (including empty results), return empty result structure
-            # This matches FastMCP's format and prevents serialization issues
-            return {"result": []}
+            return _query_error_result("studies", e)
+
+    @mcp.tool()
+    async def query_series_for_studies(
+        study_instance_uids: List[str],
+        modality: str = "",
+        series_description: str = "",
+        attribute_preset: str = "standard",
+        additional_attributes: Optional[List[str]] = None,
+        exclude_attributes: Optional[List[str]] = None,
+        ctx: Context = None
+    ) -> Dict[str, Any]:
+        """Query the series of several studies at once from the DICOM node.
+        
+        Runs one SERIES-level C-FIND per study, several at a time, so expanding a
+        list of studies from query_studies takes about as long as the slowest
+        study instead of the sum of all of them.
+        
+        Args:
+            study_instance_uids: Study Instance UIDs whose series should be listed
+            modality: Only return series of this modality, e.g. "CT"
+            series_description: Series description filter (can include wildcards)
+            attribute_preset: Controls which attributes to include in results:
+                - "minimal": Only essential attributes
+                - "standard": Common attributes (default)
+                - "extended": All available attributes
+            additional_attributes: List of specific DICOM attributes to include beyond the preset
+            exclude_attributes: List of DICOM attributes to exclude from the results
+        
+        Returns:
+            Dictionary with 'result' key containing one entry per study, in the
+            order given, with "StudyInstanceUID" and either "Series" (list of
+            series dictionaries) or "error" if that study's query failed.
+        
+        Example:
+            {
+                "result": [
+                    {
+                        "StudyInstanceUID": "1.2.840.113619.2.1.1.322.1600364094.412.1009",
+                        "Series": [
+                            {
+                                "SeriesInstanceUID": "1.2.840.113619.2.1.1.322.1600364094.412.2005",
+                                "SeriesNumber": "2",
+                                "Modality": "CT"
+                            }
+                        ]
+                    }
+                ]
+            }
+        """
+        if not study_instance_uids:
+            raise ValueError("study_instance_uids must contain at least one UID")
+        for study_uid in study_instance_uids:
+            _check_dicom_uid("study_instance_uid", study_uid)
+        _check_attribute_preset(attribute_preset)
+        
+        _, client = _config_and_client(ctx)
+        semaphore = asyncio.Semaphore(_SERIES_QUERY_PARALLELISM)
+        
+        async def query_one(study_uid: str) -> Dict[str, Any]:
+            try:
+                # Concurrent finds on one client each get their own association
+                async with semaphore:
+                    series = await asyncio.to_thread(
+                        client.query_series,
+                        study_instance_uid=study_uid,
+                        modality=modality,
+                        series_description=series_description,
+                        attribute_preset=attribute_preset,
+                        additional_attrs=additional_attributes,
+                        exclude_attrs=exclude_attributes
+                    )
+                return {"StudyInstanceUID": study_uid, "Series": series}
+            except Exception as e:
+                return {"StudyInstanceUID": study_uid, "error": str(e)}
+        
+        results = await asyncio.gather(*(query_one(uid) for uid in study_instance_uids))
+        return {"result": list(results)}
 
     @mcp.tool()
-    def move_study(
+    async def move_study(
         destination_node: str,
         study_instance_uid: str,
         ctx: Context = None
@@ -1050,25 +1842,65 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
                 "warning": 0
             }
         """
-        dicom_ctx = ctx.request_context.lifespan_context
-        config = dicom_ctx.config
-        client = dicom_ctx.client
+        _check_dicom_uid("study_instance_uid", study_instance_uid)
         
-        # Check if destination node exists
-        if destination_node not in config.nodes:
-            raise ValueError(f"Destination node '{destination_node}' not found in configuration")
+        config, client = _config_and_client(ctx)
         
-        # Get the destination AE title
-        destination_ae = config.nodes[destination_node].ae_title
+        # Check if destination node exists and get its AE title
+        destination = config.nodes.get(destination_node)
+        if destination is None:
+            raise ValueError(f"Destination node '{destination_node}' not found in configuration")
+        destination_ae = destination.ae_title
         
         # Execute the move operation
-        result = client.move_study(
+        result = await asyncio.to_thread(
+            client.move_study,
             destination_ae=destination_ae,
             study_instance_uid=study_instance_uid
         )
         
         return result
 
+    @mcp.tool()
+    async def move_series_bulk(
+        destination_node: str,
+        series_instance_uids: List[str],
+        ctx: Context = None
+    ) -> Dict[str, Any]:
+        """Move several DICOM series to another DICOM node in one batch.
+        
+        Uses a single DICOM association for the whole batch instead of one per
+        series, which matters for exports of many series.
+        
+        Args:
+            destination_node: Name of the destination node as defined in the configuration
+            series_instance_uids: The Series Instance UIDs to be moved
+        
+        Returns:
+            Dictionary containing:
+            - success: True if every series was moved
+            - message: Summary of the batch
+            - completed / failed / warning: Sub-operation counts summed over all series
+            - series: Per-series results (same fields as move_study, plus series_instance_uid)
+        """
+        config, client = _config_and_client(ctx)
+        
+        if not series_instance_uids:
+            raise ValueError("series_instance_uids must contain at least one UID")
+        for series_uid in series_instance_uids:
+            _check_dicom_uid("series_instance_uid", series_uid)
+        
+        # Check if destination node exists and get its AE title
+        destination = config.nodes.get(destination_node)
+        if destination is None:
+            raise ValueError(f"Destination node '{destination_node}' not found in configuration")
+        
+        return await asyncio.to_thread(
+            client.move_series_bulk,
+            destination_ae=destination.ae_title,
+            series_instance_uids=series_instance_uids
+        )
+
 
     @mcp.tool()
     def get_attribute_presets() -> Dict[str, Dict[str, List[str]]]:
@@ -1100,8 +1932,17 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         """
         return ATTRIBUTE_PRESETS
     
-    # FHIR Tools (only registered if FHIR client is configured)
-    @mcp.tool()
+    # FHIR Tools (only registered if FHIR client is configured). Tools are
+    # registered once per server, so the configuration as of startup decides.
+    startup_config = load_config(str(config_path_obj))
+    fhir_enabled = bool(startup_config.fhir or startup_config.fhir_servers)
+    
+    def fhir_tool(func: Callable) -> Callable:
+        """Register ``func`` as a tool when a FHIR server is configured."""
+        return mcp.tool()(func) if fhir_enabled else func
+    
+    @fhir_tool
+    @_run_in_thread
     def verify_fhir_connection(ctx: Context = None) -> str:
         """Verify connectivity to the FHIR server.
         
@@ -1121,7 +1962,8 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         success, message = dicom_ctx.fhir_client.verify_connection()
         return message
     
-    @mcp.tool()
+    @fhir_tool
+    @_run_in_thread
     def fhir_search_resource(
         type: str,
         searchParam: Optional[Union[Dict[str, Any], str]] = None,
@@ -1153,9 +1995,10 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         try:
             return dicom_ctx.fhir_client.search_resource(type, params)
         except Exception as e:
-            raise Exception(f"Error searching FHIR resource {type}: {str(e)}")
+            raise Exception(f"Error searching FHIR resource {type}: {str(e)}") from e
 
-    @mcp.tool()
+    @fhir_tool
+    @_run_in_thread
     def fhir_delete_resource(
         resource_type: str,
         resource_id: str,
@@ -1176,9 +2019,10 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         try:
             return dicom_ctx.fhir_client.delete_resource(resource_type, resource_id)
         except Exception as e:
-            raise Exception(f"Error deleting FHIR resource {resource_type}/{resource_id}: {str(e)}")
+            raise Exception(f"Error deleting FHIR resource {resource_type}/{resource_id}: {str(e)}") from e
 
-    @mcp.tool()
+    @fhir_tool
+    @_run_in_thread
     def fhir_get_capabilities(
         resource_type: str = "",
         ctx: Context = None
@@ -1196,9 +2040,10 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         try:
             return dicom_ctx.fhir_client.get_capabilities(resource_type)
         except Exception as e:
-            raise Exception(f"Error getting FHIR capabilities: {str(e)}")
+            raise Exception(f"Error getting FHIR capabilities: {str(e)}") from e
     
-    @mcp.tool()
+    @fhir_tool
+    @_run_in_thread
     def fhir_read_resource(
         resource_type: str,
         resource_id: str,
@@ -1220,9 +2065,9 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         try:
             return dicom_ctx.fhir_client.read_resource(resource_type, resource_id)
         except Exception as e:
-            raise Exception(f"Error reading FHIR resource {resource_type}/{resource_id}: {str(e)}")
+            raise Exception(f"Error reading FHIR resource {resource_type}/{resource_id}: {str(e)}") from e
     
-    @mcp.tool()
+    @fhir_tool
     def list_fhir_servers(ctx: Context = None) -> Dict[str, Any]:
         """List all configured FHIR servers and show which one is currently active.
         
@@ -1232,29 +2077,13 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         dicom_ctx = ctx.request_context.lifespan_context
         config = dicom_ctx.config
         
-        servers = {}
-        if config.fhir_servers:
-            for name, server_config in config.fhir_servers.items():
-                servers[name] = {
-                    "base_url": server_config.base_url,
-                    "description": server_config.description,
-                    "has_api_key": bool(server_config.api_key)
-                }
-        elif config.fhir:
-            # Legacy single server
-            servers["default"] = {
-                "base_url": config.fhir.base_url,
-                "description": config.fhir.description,
-                "has_api_key": bool(config.fhir.api_key)
-            }
-        
         return {
             "current_fhir": config.current_fhir or "default",
-            "servers": servers,
+            "servers": config.fhir_servers_listing,
             "status": "success"
         }
     
-    @mcp.tool()
+    @fhir_tool
     def switch_fhir_server(server_name: str, ctx: Context = None) -> Dict[str, Any]:
         """Switch the active FHIR server to a different configured server.
         
@@ -1287,18 +2116,19 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         if not config.fhir_servers:
             raise ValueError("No FHIR servers configured. Add 'fhir_servers' section to configuration.yaml")
         
-        if server_name not in config.fhir_servers:
-            available = list(config.fhir_servers.keys())
-            raise ValueError(f"FHIR server '{server_name}' not found. Available servers: {', '.join(available)}")
+        fhir_config = config.fhir_servers.get(server_name)
+        if fhir_config is None:
+            raise ValueError(
+                f"FHIR server '{server_name}' not found. Available servers: {', '.join(config.fhir_servers)}"
+            )
         
         # Update configuration
         config.current_fhir = server_name
         
-        # Get the new server configuration
-        fhir_config = config.fhir_servers[server_name]
-        
         # Create a new FHIR client with the updated configuration
         api_key = fhir_config.api_key or os.getenv("SIIM_API_KEY")
+        if dicom_ctx.fhir_client is not None:
+            dicom_ctx.fhir_client.close()
         dicom_ctx.fhir_client = FhirClient(
             base_url=fhir_config.base_url,
             api_key=api_key
@@ -1314,6 +2144,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         }
     
     @mcp.tool()
+    @_run_in_thread
     def list_mini_ris_orders(
         mrn: Optional[str] = None,
         status: Optional[str] = None,
@@ -1359,6 +2190,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         )
 
     @mcp.tool()
+    @_run_in_thread
     def list_mini_ris_patients(
         mrn: Optional[str] = None,
         name_query: Optional[str] = None,
@@ -1396,6 +2228,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         )
 
     @mcp.tool()
+    @_run_in_thread
     def create_mwl_from_order(
         order_id: int,
         scheduled_station_aet: str = "ORTHANC",
@@ -1456,56 +2289,32 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
                 "order_status": order_data.get('order_status'),
             }
         
-        # Build DICOM patient name (Family^Given)
-        patient_name = f"{order_data['family_name']}^{order_data['given_name']}"
-        
-        # Build performing physician name if available
-        performing_physician_name = None
-        if order_data.get('performing_physician_family') and order_data.get('performing_physician_given'):
-            performing_physician_name = f"{order_data['performing_physician_family']}^{order_data['performing_physician_given']}"
+        if _circuit_is_open(mwl_api_url):
+            return {
+                "success": False,
+                "message": "MWL API circuit open: recent connection attempts failed, retry shortly",
+                "order_id": order_id,
+                "accession_number": order_data['accession_number'],
+                "mwl_api_url": mwl_api_url,
+                "hint": "Ensure mwl-api service is running: docker compose up -d mwl-api",
+            }
         
-        # Build Scheduled Procedure Step Sequence (proper DICOM structure)
+        # Built (and its StudyInstanceUID generated) only once the POST will be sent
         scheduled_dt = order_data['scheduled_start']
-        scheduled_procedure_step = {
-            "Modality": order_data['modality_code'],
-            "ScheduledStationAETitle": scheduled_station_aet,
-            "ScheduledProcedureStepStartDate": scheduled_dt.strftime('%Y%m%d'),
-            "ScheduledProcedureStepStartTime": scheduled_dt.strftime('%H%M%S'),
-            "ScheduledProcedureStepDescription": order_data['procedure_description'],
-            "ScheduledProcedureStepID": f"SPS{order_data['order_id']}",
-        }
-        
-        # Add optional performing physician to SPS
-        if performing_physician_name:
-            scheduled_procedure_step["ScheduledPerformingPhysicianName"] = performing_physician_name
-        
-        # Build complete MWL payload with proper DICOM structure
-        mwl_payload = {
-            "AccessionNumber": order_data['accession_number'],
-            "PatientID": order_data['mrn'],
-            "PatientName": patient_name,
-            "PatientBirthDate": order_data['date_of_birth'].strftime('%Y%m%d'),
-            "PatientSex": order_data['sex'],
-            "StudyInstanceUID": generate_uid(),  # Generate unique Study UID
-            "RequestedProcedureDescription": order_data['procedure_description'],
-            "RequestedProcedureID": order_data['order_number'],
-            "ScheduledProcedureStepSequence": [scheduled_procedure_step],  # SPS as sequence
-        }
-        
-        # Add optional top-level fields
-        if order_data.get('reason_description'):
-            mwl_payload["RequestedProcedureComments"] = order_data['reason_description']
+        mwl_payload = _build_mwl_payload(order_data, scheduled_station_aet)
         
         # POST to mwl-api
         try:
-            response = requests.post(
+            response = _mwl_session.post(
                 f"{mwl_api_url}/mwl/create_from_json",
-                json=mwl_payload,
-                timeout=10
+                data=_json_dumps_bytes(mwl_payload)
             )
+            _circuit_record(mwl_api_url, success=True)
             response.raise_for_status()
-            mwl_result = response.json()
+            mwl_result = _json_loads(response.content)
         except requests.exceptions.RequestException as e:
+            if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                _circuit_record(mwl_api_url, success=False)
             return {
                 "success": False,
                 "message": f"Error calling MWL API: {str(e)}",
@@ -1516,28 +2325,9 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             }
         
         # Create MWL task record in mini-RIS database for audit trail
-        mwl_task_id = None
-        try:
-            from datetime import datetime, timedelta
-            
-            # Calculate scheduled_end if not provided (default: 15 minutes after start)
-            scheduled_end = order_data.get('scheduled_end')
-            if not scheduled_end and scheduled_dt:
-                scheduled_end = scheduled_dt + timedelta(minutes=15)
-            
-            mwl_task_id = dicom_ctx.mini_ris_client.create_mwl_task(
-                order_id=order_id,
-                scheduled_station_aet=scheduled_station_aet,
-                scheduled_station_name=None,  # Could be derived from station AET if needed
-                scheduled_start=scheduled_dt,
-                scheduled_end=scheduled_end,
-                scheduled_performing_provider_id=order_data.get('performing_provider_id'),
-                mwl_payload=mwl_payload,
-            )
-            logger.info(f"Created MWL task {mwl_task_id} for order {order_id}")
-        except Exception as e:
-            logger.warning(f"Failed to create MWL task record: {e}")
-            # Don't fail the whole operation if MWL task creation fails
+        mwl_task_id = _record_mwl_task(
+            dicom_ctx.mini_ris_client, order_data, scheduled_station_aet, mwl_payload
+        )
         
         return {
             "success": True,
@@ -1548,7 +2338,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             "patient_id": order_data['mrn'],
             "procedure": order_data['procedure_description'],
             "modality": order_data['modality_code'],
-            "scheduled_time": scheduled_dt.strftime('%Y-%m-%d %H:%M:%S'),
+            "scheduled_time": scheduled_dt.isoformat(sep=' ', timespec='seconds'),
             "scheduled_station_aet": scheduled_station_aet,
             "mwl_id": mwl_result.get('id'),
             "mwl_task_id": mwl_task_id,
@@ -1556,6 +2346,149 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         }
 
     @mcp.tool()
+    @_run_in_thread
+    def create_mwl_from_orders(
+        order_ids: List[int],
+        scheduled_station_aet: str = "ORTHANC",
+        mwl_api_url: str = "http://localhost:8000",
+        ctx: Context = None,
+    ) -> Dict[str, Any]:
+        """Create DICOM Modality Worklist entries for several mini-RIS orders at once.
+        
+        Batch variant of create_mwl_from_order for syncing a day's schedule: the
+        orders are fetched with one database query and the worklist entries are
+        sent to the MWL API in one request.
+        
+        Args:
+            order_ids: The mini-RIS order IDs to convert to MWL
+            scheduled_station_aet: The AE Title of the acquisition station (default: ORTHANC)
+            mwl_api_url: Base URL of the MWL API service (default: http://localhost:8000)
+            
+        Returns:
+            Dictionary with overall status and one result per order
+        """
+        dicom_ctx = ctx.request_context.lifespan_context
+        
+        if dicom_ctx.mini_ris_client is None:
+            return {
+                "success": False,
+                "message": "Mini-RIS database is not configured. Add the 'mini_ris' section to configuration.yaml.",
+            }
+        
+        if not order_ids:
+            return {
+                "success": False,
+                "message": "No order IDs provided",
+            }
+        
+        # Query all orders with one statement
+        try:
+            orders = dicom_ctx.mini_ris_client.get_orders_for_mwl(order_ids)
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Error querying orders: {str(e)}",
+                "order_ids": order_ids,
+            }
+        
+        # Collected per order and reported in request order below
+        results_by_order: Dict[int, Dict[str, Any]] = {}
+        pending = []
+        for order_id in dict.fromkeys(order_ids):
+            order_data = orders.get(order_id)
+            if not order_data:
+                results_by_order[order_id] = {
+                    "success": False,
+                    "order_id": order_id,
+                    "message": f"Order {order_id} not found in mini-RIS database",
+                }
+            elif not order_data.get('scheduled_start'):
+                results_by_order[order_id] = {
+                    "success": False,
+                    "order_id": order_id,
+                    "message": f"Order {order_id} has no scheduled start time. Cannot create MWL.",
+                    "order_status": order_data.get('order_status'),
+                }
+            else:
+                pending.append(order_data)
+        
+        if pending and _circuit_is_open(mwl_api_url):
+            return {
+                "success": False,
+                "message": "MWL API circuit open: recent connection attempts failed, retry shortly",
+                "order_ids": order_ids,
+                "mwl_api_url": mwl_api_url,
+                "hint": "Ensure mwl-api service is running: docker compose up -d mwl-api",
+            }
+        
+        if pending:
+            prepared = [
+                (order_data, _build_mwl_payload(order_data, scheduled_station_aet))
+                for order_data in pending
+            ]
+            try:
+                mwl_results = _post_mwl_batch(mwl_api_url, [payload for _, payload in prepared])
+                _circuit_record(mwl_api_url, success=True)
+            except requests.exceptions.RequestException as e:
+                if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                    _circuit_record(mwl_api_url, success=False)
+                return {
+                    "success": False,
+                    "message": f"Error calling MWL API: {str(e)}",
+                    "order_ids": order_ids,
+                    "mwl_api_url": mwl_api_url,
+                    "hint": "Ensure mwl-api service is running: docker compose up -d mwl-api",
+                }
+            
+            if len(mwl_results) != len(prepared):
+                logger.warning(
+                    "MWL API returned %d results for %d entries", len(mwl_results), len(prepared)
+                )
+            
+            for index, (order_data, mwl_payload) in enumerate(prepared):
+                order_id = order_data['order_id']
+                if index < len(mwl_results):
+                    mwl_result = mwl_results[index]
+                else:
+                    mwl_result = {"status": "error", "detail": "MWL API returned no result for this entry"}
+                if mwl_result.get('status') == 'error':
+                    results_by_order[order_id] = {
+                        "success": False,
+                        "order_id": order_id,
+                        "accession_number": order_data['accession_number'],
+                        "message": f"Error creating MWL: {mwl_result.get('detail')}",
+                    }
+                    continue
+                
+                mwl_task_id = _record_mwl_task(
+                    dicom_ctx.mini_ris_client, order_data, scheduled_station_aet, mwl_payload
+                )
+                results_by_order[order_id] = {
+                    "success": True,
+                    "order_id": order_id,
+                    "accession_number": order_data['accession_number'],
+                    "patient_name": f"{order_data['given_name']} {order_data['family_name']}",
+                    "patient_id": order_data['mrn'],
+                    "procedure": order_data['procedure_description'],
+                    "modality": order_data['modality_code'],
+                    "scheduled_time": order_data['scheduled_start'].isoformat(sep=' ', timespec='seconds'),
+                    "mwl_id": mwl_result.get('db_row_id'),
+                    "mwl_task_id": mwl_task_id,
+                }
+        
+        results = [results_by_order[order_id] for order_id in dict.fromkeys(order_ids)]
+        created = sum(1 for result in results if result["success"])
+        return {
+            "success": created == len(results),
+            "message": f"Created {created} of {len(results)} MWL entries",
+            "scheduled_station_aet": scheduled_station_aet,
+            "created_count": created,
+            "failed_count": len(results) - created,
+            "results": results,
+        }
+
+    @mcp.tool()
+    @_run_in_thread
     def create_synthetic_cr_study(
         accession_number: str,
         image_mode: str = "auto",
@@ -1600,33 +2533,9 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
                 "message": "Mini-RIS database is not configured.",
             }
         
-        # Query MWL for this accession number
+        # Query order data for this accession number
         try:
-            conn = dicom_ctx.mini_ris_client._pool.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Get order data with procedure info
-            cursor.execute("""
-                SELECT 
-                    o.order_id, o.accession_number, o.modality_code,
-                    COALESCE(o.body_part_code, proc.body_part_code, 'CHEST') as body_part_code,
-                    o.image_generation_prompt, o.report_findings_description,
-                    p.mrn, p.given_name, p.family_name, p.date_of_birth, p.sex,
-                    CONCAT(p.family_name, '^', p.given_name) as patient_name,
-                    op.procedure_description,
-                    proc.typical_views, proc.typical_image_count
-                FROM orders o
-                JOIN patients p ON o.patient_id = p.patient_id
-                JOIN order_procedures op ON o.order_id = op.order_id
-                LEFT JOIN procedures proc ON op.procedure_code = proc.procedure_code
-                WHERE o.accession_number = %s
-                LIMIT 1
-            """, (accession_number,))
-            
-            order_data = cursor.fetchone()
-            cursor.close()
-            conn.close()
-            
+            order_data = dicom_ctx.mini_ris_client.get_order_by_accession(accession_number)
         except Exception as e:
             return {
                 "success": False,
@@ -1642,9 +2551,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
                 "hint": "Create MWL entry first using create_mwl_from_order()"
             }
         
-        # Create virtual CR device
-        openai_key = os.getenv("OPENAI_API_KEY")
-        virtual_cr = VirtualCRDevice(openai_api_key=openai_key)
+        virtual_cr = _virtual_cr_device(os.getenv("OPENAI_API_KEY"))
         
         # Use image_generation_prompt from order if available, otherwise use parameter
         effective_image_description = order_data.get('image_generation_prompt') or image_description
@@ -1680,10 +2587,14 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             "num_images": study_result['num_images'],
             "image_mode": study_result['image_mode'],
             "image_description_used": effective_image_description,
-            "images": [
-                {"instance": f['instance_number'], "view": f['view']} 
-                for f in study_result['files']
-            ]
+        }
+        
+        # Per-image details are served on demand by get_synthetic_study_files
+        dicom_ctx.synthetic_studies[study_result['study_uid']] = {
+            "accession_number": accession_number,
+            "series_uid": study_result['series_uid'],
+            "files": study_result['files'],
+            "sent_to_pacs": False,
         }
         
         # Include info about whether order prompt was used
@@ -1695,13 +2606,19 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         if send_to_pacs:
             try:
                 current_node = dicom_ctx.config.nodes[dicom_ctx.config.current_node]
+                if current_node.max_parallel:
+                    # The sends open their own associations; don't keep an idle
+                    # one from our client on top of the node's limit
+                    dicom_ctx.get_client().close()
                 pacs_result = virtual_cr.send_to_pacs(
                     dicom_files=study_result['files'],
                     pacs_host=current_node.host,
                     pacs_port=current_node.port,
                     pacs_aet=current_node.ae_title,
                     calling_aet="VIRTUALCR",
-                    use_tls=current_node.use_tls
+                    use_tls=current_node.use_tls,
+                    # Stay within the associations the node accepts at once
+                    parallel_sends=min(4, len(study_result['files']), current_node.max_parallel or 4)
                 )
                 
                 result["pacs_send"] = {
@@ -1711,12 +2628,15 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
                     "destination": f"{current_node.host}:{current_node.port} ({current_node.ae_title})"
                 }
                 
+                # send_to_pacs removes the local files
+                dicom_ctx.synthetic_studies[study_result['study_uid']]["sent_to_pacs"] = True
+                
                 if pacs_result['success']:
                     result["message"] += f" and sent to PACS ({pacs_result['sent']}/{pacs_result['total']})"
                     
                     # Create imaging_study record in RIS to keep it in sync
                     try:
-                        study_started = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                        study_started = study_result['study_datetime'].isoformat(sep=' ', timespec='seconds')
                         
                         imaging_study_id = dicom_ctx.mini_ris_client.create_imaging_study(
                             order_id=order_data['order_id'],
@@ -1754,6 +2674,48 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         return result
 
     @mcp.tool()
+    def get_synthetic_study_files(
+        study_uid: str,
+        ctx: Context = None,
+    ) -> Dict[str, Any]:
+        """List the images of a study created by create_synthetic_cr_study.
+        
+        Args:
+            study_uid: StudyInstanceUID returned by create_synthetic_cr_study
+            
+        Returns:
+            Dictionary with instance number and view for each image, plus the local
+            file path while the files have not been sent to PACS
+        """
+        dicom_ctx = ctx.request_context.lifespan_context
+        
+        study = dicom_ctx.synthetic_studies.get(study_uid)
+        if study is None:
+            return {
+                "success": False,
+                "message": f"No synthetic study with UID {study_uid} was created by this server",
+                "study_uid": study_uid,
+            }
+        
+        images = []
+        for image_file in study["files"]:
+            image = {"instance": image_file.instance_number, "view": image_file.view}
+            if not study["sent_to_pacs"]:
+                image["file"] = image_file.file
+            images.append(image)
+        
+        return {
+            "success": True,
+            "study_uid": study_uid,
+            "series_uid": study["series_uid"],
+            "accession_number": study["accession_number"],
+            "sent_to_pacs": study["sent_to_pacs"],
+            "num_images": len(images),
+            "images": images,
+        }
+
+    @fhir_tool
+    @_run_in_thread
     def fhir_create_resource(
         resource: Dict[str, Any],
         ctx: Context = None
@@ -1819,9 +2781,10 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         try:
             return dicom_ctx.fhir_client.create_resource(resource)
         except Exception as e:
-            raise Exception(f"Error creating FHIR resource: {str(e)}")
+            raise Exception(f"Error creating FHIR resource: {str(e)}") from e
     
-    @mcp.tool()
+    @fhir_tool
+    @_run_in_thread
     def fhir_update_resource(
         resource: Dict[str, Any],
         ctx: Context = None
@@ -1856,13 +2819,14 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         try:
             return dicom_ctx.fhir_client.update_resource(resource)
         except Exception as e:
-            raise Exception(f"Error updating FHIR resource: {str(e)}")
+            raise Exception(f"Error updating FHIR resource: {str(e)}") from e
     
     # =========================================================================
     # Radiology Reporting Tools
     # =========================================================================
     
     @mcp.tool()
+    @_run_in_thread
     def get_study_for_report(
         accession_number: str,
         ctx: Context = None
@@ -1900,6 +2864,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         }
     
     @mcp.tool()
+    @_run_in_thread
     def list_radiologists(ctx: Context = None) -> Dict[str, Any]:
         """List available radiologists for report authorship.
         
@@ -1920,6 +2885,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         }
     
     @mcp.tool()
+    @_run_in_thread
     def create_radiology_report(
         accession_number: str,
         findings: str,
@@ -1953,9 +2919,8 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             raise ValueError("Mini-RIS database is not configured")
         
         # Validate report status
-        valid_statuses = ['Preliminary', 'Final', 'Amended', 'Cancelled']
-        if report_status not in valid_statuses:
-            raise ValueError(f"Invalid report_status. Must be one of: {', '.join(valid_statuses)}")
+        if report_status not in _VALID_REPORT_STATUSES:
+            raise ValueError(f"Invalid report_status. Must be one of: {_VALID_REPORT_STATUSES_MSG}")
         
         # Get study information
         study = dicom_ctx.mini_ris_client.get_study_by_accession(accession_number)
@@ -1987,6 +2952,7 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             author_provider_id=author_provider_id,
             report_status=report_status
         )
+        _invalidate_report(report_id)
         
         result = {
             "success": True,
@@ -2008,8 +2974,10 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         return result
     
     @mcp.tool()
+    @_run_in_thread
     def generate_report_pdf(
         report_id: int,
+        return_mode: Literal["inline", "resource"] = "resource",
         ctx: Context = None
     ) -> Dict[str, Any]:
         """Generate a professional PDF for a radiology report.
@@ -2019,37 +2987,48 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         
         Args:
             report_id: The report ID to generate PDF for
+            return_mode: "resource" (default) writes the PDF to a temporary file and
+                         returns its path; "inline" returns the PDF base64 encoded
             
         Returns:
-            Dictionary with PDF data (base64 encoded) and metadata
+            Dictionary with the PDF path (or base64 data when inline) and metadata
         """
         dicom_ctx = ctx.request_context.lifespan_context
         if not dicom_ctx.mini_ris_client:
             raise ValueError("Mini-RIS database is not configured")
         
-        # Get report with all related data
-        report_data = dicom_ctx.mini_ris_client.get_report_by_id(report_id)
-        
-        if not report_data:
-            raise ValueError(f"No report found with ID: {report_id}")
-        
-        # Generate PDF
-        pdf_bytes = generate_radiology_report_pdf(report_data)
+        if return_mode not in ("inline", "resource"):
+            raise ValueError(f"Invalid return_mode '{return_mode}'. Must be 'inline' or 'resource'")
         
-        # Encode as base64 for JSON transport
-        pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+        # Get report with all related data and render (or reuse) its PDF
+        report_data, pdf_bytes = _build_report_pdf(dicom_ctx.mini_ris_client, report_id)
         
-        return {
+        result = {
             "success": True,
             "report_id": report_id,
             "report_number": report_data['report_number'],
             "pdf_size_bytes": len(pdf_bytes),
-            "pdf_base64": pdf_base64,
             "message": f"PDF generated successfully ({len(pdf_bytes)} bytes)"
         }
+        
+        if return_mode == "inline":
+            # Encode as base64 for JSON transport (33% larger than the PDF)
+            result["pdf_base64"] = b64encode(pdf_bytes).decode('ascii')
+            return result
+        
+        # Hand the PDF out by path; removed when the server shuts down
+        with tempfile.NamedTemporaryFile(
+            prefix=f"report_{report_id}_", suffix=".pdf", delete=False
+        ) as pdf_file:
+            pdf_file.write(pdf_bytes)
+        dicom_ctx.temp_files.append(pdf_file.name)
+        
+        result["pdf_path"] = pdf_file.name
+        result["pdf_uri"] = Path(pdf_file.name).as_uri()
+        return result
     
     @mcp.tool()
-    def attach_report_to_pacs(
+    async def attach_report_to_pacs(
         report_id: int,
         ctx: Context = None
     ) -> Dict[str, Any]:
@@ -2064,6 +3043,9 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         - Ensures StudyInstanceUID is unique
         - Links PDF to correct parent study
         
+        Blocking database and HTTP calls run in worker threads so the event loop
+        stays responsive; the study lookup and PDF rendering run concurrently.
+        
         Args:
             report_id: The report ID to attach
             
@@ -2071,21 +3053,24 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             Dictionary with DICOM identifiers and upload confirmation
         """
         dicom_ctx = ctx.request_context.lifespan_context
+        if dicom_ctx.mini_ris_future is not None:
+            # Don't block the event loop on a startup connection still in progress
+            await asyncio.wrap_future(dicom_ctx.mini_ris_future)
         if not dicom_ctx.mini_ris_client:
             raise ValueError("Mini-RIS database is not configured")
         
         # Get report with all related data
-        report_data = dicom_ctx.mini_ris_client.get_report_by_id(report_id)
-        
-        if not report_data:
-            raise ValueError(f"No report found with ID: {report_id}")
+        report_data = await asyncio.to_thread(_get_report_cached, dicom_ctx.mini_ris_client, report_id)
         
         study_instance_uid = report_data.get('study_instance_uid')
         if not study_instance_uid:
             raise ValueError(f"Report {report_id} is not linked to a study with a valid StudyInstanceUID")
         
         # Log the study we're attaching to
-        logger.info(f"Attaching report {report_id} to study {study_instance_uid} (Accession: {report_data['accession_number']})")
+        logger.info(
+            "Attaching report %s to study %s (Accession: %s)",
+            report_id, study_instance_uid, report_data['accession_number']
+        )
         
         # Setup Orthanc connection
         # Orthanc REST API is on port 8042 (may use HTTPS if configured)
@@ -2093,126 +3078,112 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
         # Use HTTPS for REST API and disable SSL verification for self-signed certs
         orthanc_base_url = f"https://{current_node.host}:8042"
         
-        # Disable SSL verification for self-signed certificates
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        if _circuit_is_open(orthanc_base_url):
+            raise Exception(
+                f"Orthanc circuit open: recent connection attempts to {orthanc_base_url} failed, retry shortly"
+            )
         
         try:
-            # SANITY CHECK 1: Find the study in Orthanc by StudyInstanceUID
-            logger.info(f"Searching Orthanc for study with UID: {study_instance_uid}")
-            search_response = requests.post(
-                f"{orthanc_base_url}/tools/find",
-                json={"Level": "Study", "Query": {"StudyInstanceUID": study_instance_uid}},
-                timeout=10,
-                verify=False  # Disable SSL verification for self-signed certs
+            # SANITY CHECKS 1-3: The study exists in Orthanc and its
+            # StudyInstanceUID is unique (see _find_orthanc_study). A recent
+            # lookup of the same study is reused. The PDF (or the one cached by
+            # generate_report_pdf) only depends on the report, so it is rendered
+            # while Orthanc answers.
+            logger.info("Searching Orthanc for study with UID: %s", study_instance_uid)
+            # The DICOM metadata below uses the report_data the PDF was
+            # rendered from, so the two always describe the same report
+            (parent_study_id, orthanc_accession), (report_data, pdf_bytes) = await asyncio.gather(
+                asyncio.to_thread(_find_orthanc_study, orthanc_base_url, study_instance_uid),
+                asyncio.to_thread(_build_report_pdf, dicom_ctx.mini_ris_client, report_id),
             )
-            search_response.raise_for_status()
-            study_ids = search_response.json()
-            
-            # SANITY CHECK 2: Verify study exists
-            if not study_ids:
-                raise ValueError(
-                    f"Study with UID {study_instance_uid} not found in Orthanc PACS. "
-                    f"Ensure the imaging study exists before attaching the report."
-                )
-            
-            # SANITY CHECK 3: Ensure uniqueness (should only be one study)
-            if len(study_ids) > 1:
-                logger.warning(f"Multiple studies found with same UID: {study_ids}")
-                raise ValueError(
-                    f"Multiple studies found with StudyInstanceUID {study_instance_uid}. "
-                    f"DICOM hierarchy violation - StudyInstanceUID must be unique!"
-                )
-            
-            parent_study_id = study_ids[0]
-            logger.info(f"✓ Study verified in Orthanc (ID: {parent_study_id})")
+            logger.info("✓ Study verified in Orthanc (ID: %s)", parent_study_id)
             
             # SANITY CHECK 4: Verify AccessionNumber matches (optional but recommended)
-            study_info_response = requests.get(
-                f"{orthanc_base_url}/studies/{parent_study_id}",
-                timeout=10,
-                verify=False  # Disable SSL verification for self-signed certs
-            )
-            study_info_response.raise_for_status()
-            study_info = study_info_response.json()
-            
-            orthanc_accession = study_info.get('MainDicomTags', {}).get('AccessionNumber', '')
             ris_accession = report_data['accession_number']
             
             if orthanc_accession and orthanc_accession != ris_accession:
                 logger.warning(
-                    f"AccessionNumber mismatch: Orthanc={orthanc_accession}, RIS={ris_accession}"
+                    "AccessionNumber mismatch: Orthanc=%s, RIS=%s", orthanc_accession, ris_accession
                 )
                 # Don't fail, but warn - AccessionNumber might not always be populated
             else:
-                logger.info(f"✓ AccessionNumber verified: {ris_accession}")
+                logger.info("✓ AccessionNumber verified: %s", ris_accession)
             
-            # Generate PDF
-            logger.info("Generating report PDF...")
-            pdf_bytes = generate_radiology_report_pdf(report_data)
-            logger.info(f"✓ PDF generated ({len(pdf_bytes)} bytes)")
-            
-            # Encode PDF as base64 data URI
-            pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
-            pdf_data_uri = f"data:application/pdf;base64,{pdf_base64}"
+            logger.info("✓ PDF ready (%d bytes)", len(pdf_bytes))
             
             # Create DICOM using Orthanc API with Parent parameter
-            # Note: When using Parent, Orthanc auto-generates UIDs and inherits patient/study tags
-            # We should NOT manually specify SOPInstanceUID or SeriesInstanceUID
+            # Note: When using Parent, Orthanc inherits patient/study tags and generates
+            # the SeriesInstanceUID. The SOPInstanceUID is assigned here ("Force" lets
+            # Orthanc accept it) so it is known without reading the instance back.
             logger.info("Creating DICOM Encapsulated PDF in Orthanc...")
+            sop_instance_uid = generate_uid()
             create_payload = {
                 "Parent": parent_study_id,  # This links the PDF to the existing study
+                "Force": True,
                 "Tags": {
+                    **_REPORT_PDF_STATIC_TAGS,
                     "SeriesDescription": f"Radiology Report - {report_data['report_status']}",
-                    "Modality": "DOC",
-                    "SeriesNumber": "9999",
-                    "SOPClassUID": "1.2.840.10008.5.1.4.1.1.104.1",  # Encapsulated PDF Storage
-                    "InstanceNumber": "1",
-                    "MIMETypeOfEncapsulatedDocument": "application/pdf"
+                    "SOPInstanceUID": sop_instance_uid,
                 },
-                "Content": pdf_data_uri
             }
             
-            create_response = requests.post(
+            # The PDF goes in as a base64 data URI under "Content"; the body is
+            # written directly instead of building the encoded string first
+            create_body = await asyncio.to_thread(
+                _json_body_with_base64_content,
+                create_payload, "Content", "data:application/pdf;base64,", pdf_bytes
+            )
+            
+            create_response = await asyncio.to_thread(
+                _orthanc_session.post,
                 f"{orthanc_base_url}/tools/create-dicom",
-                json=create_payload,
-                timeout=30,
-                verify=False  # Disable SSL verification for self-signed certs
+                data=create_body,
+                headers={"Content-Type": "application/json"},
+                timeout=(_HTTP_TIMEOUT[0], 30)
             )
             
             # Log the response for debugging
             if create_response.status_code != 200:
-                logger.error(f"Orthanc rejected request. Status: {create_response.status_code}")
-                logger.error(f"Response: {create_response.text}")
+                logger.error("Orthanc rejected request. Status: %s", create_response.status_code)
+                logger.error("Response: %r", create_response.content[:512])
+                # The cached lookup may be stale (e.g. the study was deleted)
+                _remember_orthanc_study(orthanc_base_url, study_instance_uid, None)
             
             create_response.raise_for_status()
-            result = create_response.json()
+            result = _json_loads(create_response.content)
+            _remember_orthanc_study(
+                orthanc_base_url, study_instance_uid, (parent_study_id, orthanc_accession)
+            )
             
             instance_id = result.get('ID')
-            logger.info(f"✓ PDF instance created in Orthanc (ID: {instance_id})")
+            logger.info("✓ PDF instance created in Orthanc (ID: %s)", instance_id)
             
-            # Get the actual DICOM UIDs that Orthanc generated
-            instance_info_response = requests.get(
-                f"{orthanc_base_url}/instances/{instance_id}",
-                timeout=10,
-                verify=False
-            )
-            instance_info_response.raise_for_status()
-            instance_info = instance_info_response.json()
-            
-            # Extract the UIDs from Orthanc's response
-            sop_instance_uid = instance_info.get('MainDicomTags', {}).get('SOPInstanceUID', '')
-            series_uid = instance_info.get('ParentSeries', '')
+            # The create response already names the parent series; only read the
+            # instance back if this Orthanc version does not report it
+            series_uid = result.get('ParentSeries', '')
+            if not series_uid:
+                instance_info_response = await asyncio.to_thread(
+                    _orthanc_session.get,
+                    f"{orthanc_base_url}/instances/{instance_id}"
+                )
+                instance_info_response.raise_for_status()
+                instance_info = _json_loads(instance_info_response.content)
+                series_uid = instance_info.get('ParentSeries', '')
+                sop_instance_uid = instance_info.get('MainDicomTags', {}).get('SOPInstanceUID', sop_instance_uid)
             
             # Update report in database with DICOM identifiers
             if sop_instance_uid and series_uid:
-                dicom_ctx.mini_ris_client.update_report_dicom_ids(
+                await asyncio.to_thread(
+                    dicom_ctx.mini_ris_client.update_report_dicom_ids,
                     report_id=report_id,
                     dicom_sop_instance_uid=sop_instance_uid,
                     dicom_series_instance_uid=series_uid
                 )
                 logger.info("✓ Report updated in RIS database")
             
+            # The report row now carries DICOM identifiers; drop the cached copy
+            _invalidate_report(report_id)
+            
             return {
                 "success": True,
                 "report_id": report_id,
@@ -2228,11 +3199,13 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             }
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Orthanc API communication error: {e}")
-            raise Exception(f"Failed to communicate with Orthanc: {str(e)}")
+            if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                _circuit_record(orthanc_base_url, success=False)
+            logger.error("Orthanc API communication error: %s", e)
+            raise Exception(f"Failed to communicate with Orthanc: {str(e)}") from e
         except Exception as e:
-            logger.error(f"Failed to attach report: {e}")
-            raise Exception(f"Failed to attach report to PACS: {str(e)}")
+            logger.error("Failed to attach report: %s", e)
+            raise Exception(f"Failed to attach report to PACS: {str(e)}") from e
     
     @mcp.tool()
     def get_system_prompt(ctx: Context = None) -> Dict[str, Any]:
@@ -2245,33 +3218,10 @@ def create_dicom_mcp_server(config_path: str, name: str = "DICOM MCP") -> FastMC
             Dictionary containing the system prompt text
         """
         try:
-            # Try to read from system_prompt.txt in the project root
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(os.path.dirname(script_dir))
-            prompt_path = os.path.join(project_root, "system_prompt.txt")
-            
-            if os.path.exists(prompt_path):
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    prompt_text = f.read().strip()
-            else:
-                # Fallback to default prompt if file doesn't exist
-                prompt_text = """You are a medical imaging assistant specialized in DICOM and FHIR workflows. Help users query, analyze, and manage medical imaging data efficiently using the available DICOM tools, including DIMSE, FHIR and DicomWeb.
-
-Key responsibilities:
-- Assist with patient, study, series, and instance queries using the DICOM tools.
-- Assist with reading, writing and analyzing data using FHIR tools (work in progress).
-- Extract and summarize text from DICOM-encapsulated PDF reports
-- Help transfer DICOM data between nodes using C-MOVE operations
-- Provide clear explanations of DICOM concepts and operations
-- Always prioritize data privacy and security
-
-Important reminders:
-- This tool is for research and development purposes only
-- Never make clinical diagnoses based on the data
-- Verify patient information before sharing results
-- Use clear, clinical language when appropriate
-- Most data is retrieved as JSON, but please present the data in either JSON or a tabular form that is human readable.
-- When extracting text from DICOM PDF reports, summarize findings clearly, highlight key measurements and recommendations, and maintain clinical accuracy in your summaries. Organize information in a structured format that's easy to read and understand."""
+            # Prefer system_prompt.txt in the project root, else the built-in default
+            prompt_text = _load_system_prompt()
+            if prompt_text is None:
+                prompt_text = _DEFAULT_SYSTEM_PROMPT
             
             return {
                 "success": True,
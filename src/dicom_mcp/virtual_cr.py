@@ -8,13 +8,17 @@ NOT for clinical use or diagnosis. NOT based on real patient data.
 import base64
 import io
 import logging
+import math
 import os
 import ssl
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 import numpy as np
 import pydicom
@@ -35,6 +39,14 @@ except ImportError:
 logger = logging.getLogger("dicom_mcp.virtual_cr")
 
 
+@dataclass(slots=True)
+class SyntheticImageFile:
+    """A DICOM file written by the virtual CR device."""
+    file: str
+    instance_number: int
+    view: str
+
+
 class VirtualCRDevice:
     """Simulates a CR device that generates synthetic DICOM images."""
     
@@ -93,7 +105,11 @@ class VirtualCRDevice:
         study_uid = mwl_data.get('StudyInstanceUID', generate_uid())
         series_uid = generate_uid()
         
-        created_files = []
+        # One timestamp for the whole study, formatted once and sliced per image
+        study_datetime = datetime.now()
+        study_stamp = study_datetime.strftime('%Y%m%d%H%M%S')
+        
+        created_files: List[SyntheticImageFile] = []
         for idx, view in enumerate(views, 1):
             try:
                 # Generate image
@@ -132,14 +148,15 @@ class VirtualCRDevice:
                     study_uid=study_uid,
                     series_uid=series_uid,
                     instance_number=idx,
-                    view=view
+                    view=view,
+                    study_stamp=study_stamp
                 )
                 
-                created_files.append({
-                    'file': dcm_file,
-                    'instance_number': idx,
-                    'view': view
-                })
+                created_files.append(SyntheticImageFile(
+                    file=dcm_file,
+                    instance_number=idx,
+                    view=view
+                ))
                 
             except Exception as e:
                 import traceback
@@ -153,6 +170,7 @@ class VirtualCRDevice:
             'series_uid': series_uid,
             'num_images': len(created_files),
             'files': created_files,
+            'study_datetime': study_datetime,
             'image_mode': image_mode
         }
     
@@ -252,6 +270,14 @@ class VirtualCRDevice:
         
         return Image.fromarray(img_array)
     
+    @cached_property
+    def _openai_client(self) -> "OpenAI":
+        """OpenAI client (extended timeout) reused for every image this device generates."""
+        return OpenAI(
+            api_key=self.openai_api_key,
+            timeout=90.0
+        )
+    
     def _generate_ai_image(
         self, modality: str, body_part: str, view: str, description: str
     ) -> Image.Image:
@@ -268,16 +294,10 @@ class VirtualCRDevice:
         
         logger.info(f"Prompt: {prompt[:150]}...")
         
-        # Initialize OpenAI client with extended timeout
-        client = OpenAI(
-            api_key=self.openai_api_key,
-            timeout=90.0
-        )
-        
         # Generate with gpt-image-1
         try:
             logger.info("Generating with gpt-image-1.5")
-            response = client.images.generate(
+            response = self._openai_client.images.generate(
                 model="gpt-image-1.5",
                 prompt=prompt,
                 size="1024x1024",  # Can use "512x512" for faster generation
@@ -306,7 +326,7 @@ class VirtualCRDevice:
                 
         except Exception as e:
             logger.error(f"gpt-image-1 generation failed: {e}", exc_info=True)
-            raise Exception(f"gpt-image-1 failed: {str(e)}")
+            raise Exception(f"gpt-image-1 failed: {str(e)}") from e
         
         # Convert to grayscale and resize to CR dimensions
         img = Image.open(io.BytesIO(image_data)).convert('L')
@@ -433,9 +453,16 @@ medical training purposes only. Photographic realism required. Single body part
         study_uid: str,
         series_uid: str,
         instance_number: int,
-        view: str
+        view: str,
+        study_stamp: Optional[str] = None
     ) -> str:
-        """Create DICOM file from image and MWL data."""
+        """Create DICOM file from image and MWL data.
+        
+        ``study_stamp`` is the study date/time as YYYYMMDDHHMMSS; defaults to now.
+        """
+        if study_stamp is None:
+            study_stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+        
         # Create temporary file
         temp_file = tempfile.NamedTemporaryFile(
             suffix='.dcm', delete=False, mode='wb'
@@ -473,8 +500,8 @@ medical training purposes only. Photographic realism required. Single body part
         
         # Study Module
         ds.StudyInstanceUID = study_uid
-        ds.StudyDate = datetime.now().strftime('%Y%m%d')
-        ds.StudyTime = datetime.now().strftime('%H%M%S')
+        ds.StudyDate = study_stamp[:8]
+        ds.StudyTime = study_stamp[8:]
         ds.AccessionNumber = mwl_data.get('accession_number', mwl_data.get('AccessionNumber', '')) or ''
         ds.StudyDescription = mwl_data.get('procedure_description', 'CR Study')
         
@@ -519,16 +546,19 @@ medical training purposes only. Photographic realism required. Single body part
     
     def send_to_pacs(
         self,
-        dicom_files: list,
+        dicom_files: List[SyntheticImageFile],
         pacs_host: str,
         pacs_port: int,
         pacs_aet: str,
         calling_aet: str = "VIRTUALCR",
-        use_tls: bool = True
+        use_tls: bool = True,
+        parallel_sends: int = 1
     ) -> Dict[str, Any]:
-        """Send DICOM files to PACS using pynetdicom with TLS support."""
-        results = []
+        """Send DICOM files to PACS using pynetdicom with TLS support.
         
+        The files are split into ``parallel_sends`` chunks; each chunk is sent
+        over its own association from a worker thread.
+        """
         # Create Application Entity
         ae = AE(ae_title=calling_aet)
         ae.add_requested_context(ComputedRadiographyImageStorage)
@@ -542,13 +572,9 @@ medical training purposes only. Photographic realism required. Single body part
             tls_args = {'tls_args': (ssl_context, None)}
             logger.info(f"Using TLS connection to {pacs_host}:{pacs_port}")
         
-        # Send each file
-        for file_info in dicom_files:
-            dcm_file = file_info['file']
+        def send_chunk(chunk: List[SyntheticImageFile]) -> List[Dict[str, Any]]:
+            chunk_results = []
             try:
-                # Read DICOM file
-                ds = pydicom.dcmread(dcm_file)
-                
                 # Associate with PACS
                 assoc = ae.associate(
                     pacs_host,
@@ -556,49 +582,75 @@ medical training purposes only. Photographic realism required. Single body part
                     ae_title=pacs_aet,
                     **tls_args
                 )
-                
+            except Exception as e:
+                logger.error(f"Error associating with {pacs_aet}: {e}")
+                return [
+                    {'file': f.file, 'instance': f.instance_number, 'success': False, 'error': str(e)}
+                    for f in chunk
+                ]
+            
+            if not assoc.is_established:
+                logger.error(f"Association rejected by {pacs_aet}")
+                return [
+                    {'file': f.file, 'instance': f.instance_number, 'success': False, 'error': 'Association rejected'}
+                    for f in chunk
+                ]
+            
+            try:
+                for file_info in chunk:
+                    dcm_file = file_info.file
+                    try:
+                        # Read DICOM file and send C-STORE
+                        ds = pydicom.dcmread(dcm_file)
+                        status = assoc.send_c_store(ds)
+                        
+                        success = bool(status) and status.Status == 0x0000
+                        
+                        chunk_results.append({
+                            'file': dcm_file,
+                            'instance': file_info.instance_number,
+                            'sop_instance_uid': str(ds.SOPInstanceUID),
+                            'success': success,
+                            'message': f"Status: 0x{status.Status:04X}" if status else "No response"
+                        })
+                        
+                        if success:
+                            logger.info(f"Sent image {file_info.instance_number} to PACS successfully")
+                        elif status:
+                            logger.error(f"Failed to send image {file_info.instance_number}: Status 0x{status.Status:04X}")
+                        else:
+                            logger.error(f"Failed to send image {file_info.instance_number}: no response")
+                    except Exception as e:
+                        logger.error(f"Error sending {dcm_file}: {e}")
+                        chunk_results.append({
+                            'file': dcm_file,
+                            'instance': file_info.instance_number,
+                            'success': False,
+                            'error': str(e)
+                        })
+            finally:
+                # Release association
                 if assoc.is_established:
-                    # Send C-STORE
-                    status = assoc.send_c_store(ds)
-                    
-                    success = status and status.Status == 0x0000
-                    
-                    results.append({
-                        'file': dcm_file,
-                        'instance': file_info['instance_number'],
-                        'success': success,
-                        'message': f"Status: 0x{status.Status:04X}" if status else "No response"
-                    })
-                    
-                    if success:
-                        logger.info(f"Sent image {file_info['instance_number']} to PACS successfully")
-                    else:
-                        logger.error(f"Failed to send image {file_info['instance_number']}: Status 0x{status.Status:04X}")
-                    
-                    # Release association
                     assoc.release()
-                else:
-                    logger.error(f"Association rejected by {pacs_aet}")
-                    results.append({
-                        'file': dcm_file,
-                        'instance': file_info['instance_number'],
-                        'success': False,
-                        'error': 'Association rejected'
-                    })
-                
-            except Exception as e:
-                logger.error(f"Error sending {dcm_file}: {e}")
-                results.append({
-                    'file': dcm_file,
-                    'instance': file_info['instance_number'],
-                    'success': False,
-                    'error': str(e)
-                })
+            
+            return chunk_results
+        
+        results = []
+        if dicom_files:
+            workers = max(1, min(parallel_sends, len(dicom_files)))
+            chunk_size = math.ceil(len(dicom_files) / workers)
+            chunks = [dicom_files[i:i + chunk_size] for i in range(0, len(dicom_files), chunk_size)]
+            
+            # Round trips dominate, so one thread per association overlaps them;
+            # map() keeps the results in the original file order
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                for chunk_results in executor.map(send_chunk, chunks):
+                    results.extend(chunk_results)
         
         # Clean up temporary files
         for file_info in dicom_files:
             try:
-                os.unlink(file_info['file'])
+                os.unlink(file_info.file)
             except:
                 pass
         
@@ -19,9 +19,7 @@ from contextlib import asynccontextmanager
 
 from .server import create_dicom_mcp_server
 from .config import load_config
-from .dicom_client import DicomClient
 from .fhir_client import FhirClient
-from .mysql_client import MiniRisClient, MiniRisConnectionSettings
 from .resources import load_resource_catalog
 from mcp.server.fastmcp import Context
 
@@ -111,14 +109,6 @@ async def lifespan_manager(app: FastAPI):
     
     config_path_obj = Path(config_path).resolve()
     config = load_config(str(config_path_obj))
-    current_node = config.nodes[config.current_node]
-    
-    client = DicomClient(
-        host=current_node.host,
-        port=current_node.port,
-        calling_aet=config.calling_aet,
-        called_aet=current_node.ae_title
-    )
     
     fhir_client = None
     fhir_config = None
@@ -139,35 +129,23 @@ async def lifespan_manager(app: FastAPI):
             api_key=api_key
         )
     
-    mini_ris_client = None
     resources_dir = config_path_obj.parent / "resources"
     resource_catalog = load_resource_catalog(resources_dir)
-    if config.mini_ris:
-        try:
-            mini_ris_settings = MiniRisConnectionSettings(
-                host=config.mini_ris.host,
-                port=config.mini_ris.port,
-                user=config.mini_ris.user,
-                password=config.mini_ris.password,
-                database=config.mini_ris.database,
-                pool_size=config.mini_ris.pool_size,
-            )
-            mini_ris_client = MiniRisClient(mini_ris_settings)
-            mini_ris_client.ping()
-        except Exception:
-            pass  # Optional, continue without mini-RIS
     
-    from .server import DicomContext
+    from .server import DicomContext, connect_mini_ris_in_background
     mcp_lifespan_context = DicomContext(
         config=config,
-        client=client,
         fhir_client=fhir_client,
-        mini_ris_client=mini_ris_client,
+        mini_ris_future=connect_mini_ris_in_background(config.mini_ris) if config.mini_ris else None,
         resources=resource_catalog,
     )
     
     yield
     
+    await asyncio.gather(*(pooled.aclose() for pooled in mcp_lifespan_context.clients.values()))
+    if mcp_lifespan_context.fhir_client is not None:
+        mcp_lifespan_context.fhir_client.close()
+    mcp_lifespan_context.remove_temp_files()
     mcp_lifespan_context = None
 
 
@@ -0,0 +1,28 @@
+"""
+Tests for attribute preset resolution (no DICOM server required).
+"""
+from dicom_mcp.attributes import ATTRIBUTE_PRESETS, get_attributes_for_level
+
+
+def test_presets_returned_to_callers_do_not_affect_queries():
+    expected = list(ATTRIBUTE_PRESETS["minimal"]["study"])
+    ATTRIBUTE_PRESETS["minimal"]["study"].append("PatientComments")
+    try:
+        assert get_attributes_for_level("study", "minimal") == expected
+    finally:
+        ATTRIBUTE_PRESETS["minimal"]["study"].remove("PatientComments")
+
+
+def test_unknown_preset_falls_back_to_standard():
+    attrs = get_attributes_for_level("series", "bogus", ["SeriesDate"], ["PatientPosition"])
+
+    assert attrs[:-1] == [a for a in ATTRIBUTE_PRESETS["standard"]["series"] if a != "PatientPosition"]
+    assert attrs[-1] == "SeriesDate"
+
+
+def test_resolved_attributes_are_cached_and_copied():
+    first = get_attributes_for_level("study", "minimal", ["AccessionNumber"], ["StudyDate"])
+    first.append("PatientComments")
+
+    second = get_attributes_for_level("study", "minimal", ["AccessionNumber"], ["StudyDate"])
+    assert second == ["StudyInstanceUID", "PatientID", "StudyDescription", "AccessionNumber"]
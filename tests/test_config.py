@@ -0,0 +1,86 @@
+"""
+Tests for configuration loading (no DICOM server required).
+"""
+import os
+
+from dicom_mcp.config import load_config
+
+CONFIG_TEMPLATE = """
+nodes:
+  main:
+    host: localhost
+    port: 4242
+    ae_title: ORTHANC
+  backup:
+    host: backup.local
+    port: 104
+    ae_title: BACKUP
+current_node: {current}
+calling_aet: MCPSCU
+"""
+
+
+def test_load_config_returns_independent_copies(tmp_path):
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text(CONFIG_TEMPLATE.format(current="main"))
+
+    first = load_config(str(config_file))
+    first.current_node = "backup"
+
+    second = load_config(str(config_file))
+    assert second.current_node == "main"
+    assert second is not first
+
+
+def test_load_config_rereads_modified_file(tmp_path):
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text(CONFIG_TEMPLATE.format(current="main"))
+    assert load_config(str(config_file)).current_node == "main"
+
+    config_file.write_text(CONFIG_TEMPLATE.format(current="backup"))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_config(str(config_file)).current_node == "backup"
+
+
+def test_nodes_listing_names_all_nodes(tmp_path):
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text(CONFIG_TEMPLATE.format(current="main"))
+
+    assert load_config(str(config_file)).nodes_listing == "main, backup"
+
+
+def test_fhir_servers_listing_falls_back_to_legacy_entry(tmp_path):
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text(
+        CONFIG_TEMPLATE.format(current="main")
+        + "fhir:\n  base_url: http://fhir.local/fhir\n  api_key: secret\n"
+    )
+
+    assert load_config(str(config_file)).fhir_servers_listing == {
+        "default": {"base_url": "http://fhir.local/fhir", "description": "", "has_api_key": True}
+    }
+
+
+def test_load_config_rereads_file_rewritten_with_same_mtime(tmp_path):
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text(CONFIG_TEMPLATE.format(current="main"))
+    stat = config_file.stat()
+    assert load_config(str(config_file)).current_node == "main"
+
+    config_file.write_text(CONFIG_TEMPLATE.format(current="backup"))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert load_config(str(config_file)).current_node == "backup"
+
+
+def test_load_config_follows_environment_changes(tmp_path, monkeypatch):
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text(CONFIG_TEMPLATE.format(current="${DICOM_MCP_TEST_NODE}"))
+
+    monkeypatch.setenv("DICOM_MCP_TEST_NODE", "main")
+    assert load_config(str(config_file)).current_node == "main"
+
+    monkeypatch.setenv("DICOM_MCP_TEST_NODE", "backup")
+    assert load_config(str(config_file)).current_node == "backup"
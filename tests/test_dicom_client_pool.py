@@ -0,0 +1,116 @@
+"""
+Tests for DicomClient association reuse (no DICOM server required).
+"""
+from dicom_mcp.dicom_client import DicomClient
+
+
+class FakeAssociation:
+    def __init__(self):
+        self.is_established = True
+        self.released = False
+
+    def release(self):
+        self.is_established = False
+        self.released = True
+
+
+def make_client(monkeypatch, linger_timeout, max_parallel=0):
+    client = DicomClient(
+        "localhost", 4242, "MCPSCU", "ORTHANC", linger_timeout=linger_timeout, max_parallel=max_parallel
+    )
+    created = []
+
+    def fake_associate(*args, **kwargs):
+        created.append(FakeAssociation())
+        return created[-1]
+
+    monkeypatch.setattr(client, "_associate", fake_associate)
+    return client, created
+
+
+def test_lingering_association_is_reused_until_closed(monkeypatch):
+    client, created = make_client(monkeypatch, linger_timeout=60)
+
+    with client._association() as first:
+        pass
+    with client._association() as second:
+        # A concurrent request gets its own one-off association
+        with client._association() as concurrent:
+            assert concurrent is not second
+        assert concurrent.released
+
+    assert second is first
+    assert not first.released
+    assert len(created) == 2
+
+    client.close()
+    assert first.released
+
+
+def test_without_linger_each_request_releases(monkeypatch):
+    client, created = make_client(monkeypatch, linger_timeout=0)
+
+    with client._association():
+        pass
+    with client._association():
+        pass
+
+    assert len(created) == 2
+    assert all(assoc.released for assoc in created)
+
+
+def test_async_context_manager_releases_lingering_association(monkeypatch):
+    import asyncio
+
+    client, created = make_client(monkeypatch, linger_timeout=60)
+
+    async def use_client():
+        async with client:
+            with client._association():
+                pass
+            assert not created[0].released
+
+    asyncio.run(use_client())
+    assert created[0].released
+
+
+def test_max_parallel_waits_for_a_free_slot(monkeypatch):
+    import threading
+
+    client, created = make_client(monkeypatch, linger_timeout=0, max_parallel=1)
+
+    entered = threading.Event()
+
+    def second_request():
+        with client._association():
+            entered.set()
+
+    with client._association():
+        worker = threading.Thread(target=second_request)
+        worker.start()
+        assert not entered.wait(0.2)
+        assert len(created) == 1
+    worker.join(timeout=5)
+
+    assert entered.is_set()
+    assert len(created) == 2
+
+
+def test_lingering_association_keeps_its_slot_until_released(monkeypatch):
+    client, created = make_client(monkeypatch, linger_timeout=60, max_parallel=1)
+
+    with client._association() as lingering:
+        pass
+    assert not client._slots.acquire(blocking=False)
+
+    # An operation that opens its own association frees the idle one first
+    with client._slot():
+        assert lingering.released
+    assert client._slots.acquire(blocking=False)
+    client._slots.release()
+
+    with client._association():
+        pass
+    client.close()
+    assert created[-1].released
+    assert client._slots.acquire(blocking=False)
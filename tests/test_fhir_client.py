@@ -0,0 +1,49 @@
+"""
+Tests for FhirClient request handling (no FHIR server required).
+"""
+import json
+
+from dicom_mcp.fhir_client import FhirClient
+
+
+class FakeResponse:
+    status_code = 201
+
+    def __init__(self, body):
+        self.content = json.dumps(body).encode()
+
+    def raise_for_status(self):
+        pass
+
+
+def test_repeated_searches_are_cached_until_a_write(monkeypatch):
+    client = FhirClient("http://fhir.local/fhir")
+    gets = []
+
+    def fake_get(url, params=None, timeout=None):
+        gets.append((url, params))
+        return FakeResponse({"resourceType": "Bundle", "total": len(gets)})
+
+    monkeypatch.setattr(client._http, "get", fake_get)
+    monkeypatch.setattr(client._http, "post", lambda *a, **kw: FakeResponse({"id": "1"}))
+
+    first = client.search_resource("Patient", {"name": "Smith", "gender": "female"})
+    assert client.search_resource("Patient", {"gender": "female", "name": "Smith"}) == first
+    assert len(gets) == 1
+
+    client.create_resource({"resourceType": "Patient"})
+    assert client.search_resource("Patient", {"name": "Smith", "gender": "female"})["total"] == 2
+    client.close()
+
+
+def test_modifying_a_cached_read_does_not_affect_later_reads(monkeypatch):
+    client = FhirClient("http://fhir.local/fhir")
+    monkeypatch.setattr(
+        client._http, "get", lambda *a, **kw: FakeResponse({"resourceType": "Patient", "id": "1", "active": True})
+    )
+
+    patient = client.read_resource("Patient", "1")
+    patient["active"] = False
+
+    assert client.read_resource("Patient", "1")["active"] is True
+    client.close()
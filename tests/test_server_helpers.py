@@ -0,0 +1,223 @@
+"""
+Unit tests for the module-level helpers in dicom_mcp.server (no PACS required).
+"""
+from datetime import date, datetime
+
+import pytest
+
+from dicom_mcp import server
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_state():
+    server._circuit_state.clear()
+    yield
+    server._circuit_state.clear()
+
+
+def make_order(**overrides):
+    order = {
+        "order_id": 7,
+        "order_number": "ORD-7",
+        "accession_number": "ACC0007",
+        "modality_code": "CR",
+        "scheduled_start": datetime(2025, 3, 4, 9, 5, 7),
+        "mrn": "MRN123",
+        "given_name": "Jane",
+        "family_name": "Doe",
+        "date_of_birth": date(1980, 1, 2),
+        "sex": "F",
+        "procedure_description": "XR CHEST 2V",
+    }
+    order.update(overrides)
+    return order
+
+
+def test_build_mwl_payload_formats_dates_and_names():
+    payload = server._build_mwl_payload(make_order(), "CR01")
+
+    assert payload["PatientName"] == "Doe^Jane"
+    assert payload["PatientBirthDate"] == "19800102"
+    assert payload["StudyInstanceUID"].startswith("2.25.")
+    sps = payload["ScheduledProcedureStepSequence"][0]
+    assert sps["ScheduledProcedureStepStartDate"] == "20250304"
+    assert sps["ScheduledProcedureStepStartTime"] == "090507"
+    assert sps["ScheduledStationAETitle"] == "CR01"
+    assert sps["ScheduledProcedureStepID"] == "SPS7"
+    assert "ScheduledPerformingPhysicianName" not in sps
+    assert "RequestedProcedureComments" not in payload
+
+
+def test_build_mwl_payload_does_not_share_sps_between_orders():
+    first = server._build_mwl_payload(
+        make_order(performing_physician_family="Smith", performing_physician_given="Ann"), "CR01"
+    )
+    second = server._build_mwl_payload(make_order(), "CR01")
+
+    assert first["ScheduledProcedureStepSequence"][0]["ScheduledPerformingPhysicianName"] == "Smith^Ann"
+    assert "ScheduledPerformingPhysicianName" not in second["ScheduledProcedureStepSequence"][0]
+    assert "ScheduledPerformingPhysicianName" not in server._SPS_TEMPLATE
+
+
+def test_circuit_opens_after_threshold_and_resets_on_success():
+    url = "http://mwl-api:8000"
+    for _ in range(server._CIRCUIT_FAILURE_THRESHOLD - 1):
+        server._circuit_record(url, success=False)
+    assert not server._circuit_is_open(url)
+
+    server._circuit_record(url, success=False)
+    assert server._circuit_is_open(url)
+    # Keyed by host, so other paths on the same host are short-circuited too
+    assert server._circuit_is_open(f"{url}/mwl/create_from_json")
+
+    server._circuit_record(url, success=True)
+    assert not server._circuit_is_open(url)
+
+
+def test_circuit_closes_after_cooldown(monkeypatch):
+    url = "https://orthanc:8042"
+    for _ in range(server._CIRCUIT_FAILURE_THRESHOLD):
+        server._circuit_record(url, success=False)
+    assert server._circuit_is_open(url)
+
+    opened_at = server._circuit_state["orthanc:8042"][1]
+    monkeypatch.setattr(server.time, "monotonic", lambda: opened_at + server._CIRCUIT_COOLDOWN_SECONDS)
+    assert not server._circuit_is_open(url)
+
+
+def test_json_body_with_base64_content_round_trips():
+    import base64
+    import json
+
+    pdf_bytes = bytes(range(256)) * 500  # spans several encode chunks
+    body = server._json_body_with_base64_content(
+        {"Parent": "abc", "Tags": {"SeriesDescription": "Report \"Final\""}},
+        "Content",
+        "data:application/pdf;base64,",
+        pdf_bytes,
+    )
+
+    assert body.endswith(b"\"}")  # preallocated to the exact size, no zero padding left
+    decoded = json.loads(bytes(body))
+    assert decoded["Parent"] == "abc"
+    assert decoded["Tags"]["SeriesDescription"] == 'Report "Final"'
+    assert decoded["Content"] == "data:application/pdf;base64," + base64.b64encode(pdf_bytes).decode()
+
+
+def test_find_orthanc_study_reuses_recent_lookup(monkeypatch):
+    class FakeResponse:
+        content = b'[{"ID": "orthanc-study", "MainDicomTags": {"AccessionNumber": "ACC1"}}]'
+
+        def raise_for_status(self):
+            pass
+
+    calls = []
+    monkeypatch.setattr(server._orthanc_session, "post", lambda *a, **kw: calls.append(a) or FakeResponse())
+    server._study_lookup_cache.clear()
+
+    base = "https://orthanc:8042"
+    assert server._find_orthanc_study(base, "1.2.3") == ("orthanc-study", "ACC1")
+    assert server._find_orthanc_study(base, "1.2.3") == ("orthanc-study", "ACC1")
+    assert len(calls) == 1
+
+    server._remember_orthanc_study(base, "1.2.3", None)
+    server._find_orthanc_study(base, "1.2.3")
+    assert len(calls) == 2
+    server._study_lookup_cache.clear()
+
+
+@pytest.mark.parametrize("value", ["", "20230101", "20230101-20230131", "20230101-", "-20230131"])
+def test_check_dicom_date_accepts_dates_and_ranges(value):
+    server._check_dicom_date("study_date", value)
+
+
+@pytest.mark.parametrize("value", ["2023-01-01", "202301", "20230101-2023", "-"])
+def test_check_dicom_date_rejects_malformed_values(value):
+    with pytest.raises(ValueError):
+        server._check_dicom_date("study_date", value)
+
+
+def test_check_dicom_uid_accepts_uid_lists_and_rejects_wildcards():
+    server._check_dicom_uid("study_instance_uid", "1.2.840.10008.1.1\\2.25.123")
+    for bad in ("1.2.*", "1..2", "abc", "1.2."):
+        with pytest.raises(ValueError):
+            server._check_dicom_uid("study_instance_uid", bad)
+
+
+def test_query_error_result_reraises_connection_errors_only():
+    with pytest.raises(Exception, match="Error querying studies: Failed to associate") as excinfo:
+        server._query_error_result("studies", Exception("Failed to associate with DICOM node"))
+    assert excinfo.value.__cause__ is not None
+
+    assert server._query_error_result("studies", KeyError("PatientName")) == {"result": []}
+
+
+def test_check_attribute_preset_rejects_unknown_names():
+    server._check_attribute_preset("extended")
+    with pytest.raises(ValueError, match="minimal, standard, extended"):
+        server._check_attribute_preset("full")
+
+
+def test_remove_temp_files_deletes_handed_out_files(tmp_path):
+    report = tmp_path / "report.pdf"
+    report.write_bytes(b"%PDF")
+    dicom_ctx = server.DicomContext(config=None, temp_files=[str(report), str(tmp_path / "gone.pdf")])
+
+    dicom_ctx.remove_temp_files()
+
+    assert not report.exists()
+    assert dicom_ctx.temp_files == []
+
+
+def test_post_mwl_batch_fallback_raises_when_nothing_connects(monkeypatch):
+    import requests
+
+    class NoBatchEndpoint:
+        status_code = 404
+
+    def fake_post(url, **kwargs):
+        if url.endswith("_batch"):
+            return NoBatchEndpoint()
+        raise requests.exceptions.ConnectionError("connection refused")
+
+    monkeypatch.setattr(server._mwl_session, "post", fake_post)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        server._post_mwl_batch("http://mwl-api:8000", [{"AccessionNumber": "A1"}, {"AccessionNumber": "A2"}])
+
+
+def test_circuit_record_counts_concurrent_failures():
+    import threading
+
+    url = "http://mwl-api:8000"
+    workers = [
+        threading.Thread(target=lambda: [server._circuit_record(url, success=False) for _ in range(200)])
+        for _ in range(8)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert server._circuit_state["mwl-api:8000"][0] == 1600
+
+
+def test_build_report_pdf_rerenders_when_the_report_row_changed(monkeypatch):
+    import sys
+    import types
+
+    fake_generator = types.ModuleType("dicom_mcp.report_generator")
+    fake_generator.generate_radiology_report_pdf_to = lambda report_data, buffer: buffer.write(
+        report_data["report_status"].encode()
+    )
+    monkeypatch.setitem(sys.modules, "dicom_mcp.report_generator", fake_generator)
+
+    old_row = {"report_status": "Preliminary", "updated_at": datetime(2025, 1, 1, 8, 0)}
+    new_row = {"report_status": "Final", "updated_at": datetime(2025, 1, 1, 9, 0)}
+    monkeypatch.setitem(server._report_cache, 42, new_row)
+    monkeypatch.setitem(server._report_pdf_cache, 42, (old_row, memoryview(b"Preliminary")))
+
+    report_data, pdf = server._build_report_pdf(None, 42)
+
+    assert report_data is new_row
+    assert bytes(pdf) == b"Final"